@@ -1,16 +1,122 @@
-from abc import ABC, abstractmethod
-from typing import Final
-from itertools import chain
+from typing import Callable, Final
+from functools import lru_cache
+from string import Formatter
+import threading
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import requests_cache
 from bs4 import BeautifulSoup
+from lxml import etree, html
 from utils.scrap_utils import get_settings
 
+# Timeout (seconds) used for every request sent by the marathon classes.
+REQUEST_TIMEOUT: Final[int] = 10
+# User-Agent sent with every request, set once on the sessions.
+USER_AGENT: Final[str] = (
+    "marathons_scrapy (+https://github.com/AYSIK0/PGMP-Marathon-Dropout)"
+)
+# Headers used to only request the end of a result page, where the pagination div is.
+TAIL_HEADERS: Final[dict[str, str]] = {
+    "Range": "bytes=-32768",
+    "Accept-Encoding": "identity",
+}
+# lxml parsers are not thread-safe, so each thread reuses its own parser instance.
+_PARSERS = threading.local()
+# Placeholder used to split URL templates around the page number.
+_PAGE_MARKER: Final[str] = "\0"
+# Links of the pagination div of the result pages, the last one is the "next" arrow.
+_PAGES_LINKS_XPATH: Final[etree.XPath] = etree.XPath(
+    '//div[contains(@class, "pages")]//a'
+)
+
+
+class MarathonFetchError(RuntimeError):
+    """
+    ### Exception raised when a marathon results page could not be requested.
+    """
+
+
+@lru_cache(maxsize=None)
+def _compile_url_template(template: str) -> Callable[..., str]:
+    """
+    ### Convert a `str.format` URL template with positional fields (e.g. `{0}`, `{1}`) into a faster `%` formatting function.
+    ---
+    ### Arguments:
+    - template: URL template to compile.
+    ---
+    ### Returns:
+    A function that takes the template fields as positional arguments and returns the URL, \
+    extra arguments are ignored like `str.format` does (e.g. the event id of a template with a fixed event), \
+    falls back to `template.format` if the template has named, unordered or formatted fields.
+    """
+    parts = []
+    n_fields = 0
+    fields = Formatter().parse(template)
+    for idx, (literal, field, spec, conversion) in enumerate(fields):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if field not in ("", str(idx)) or spec or conversion:
+            return template.format
+        parts.append("%s")
+        n_fields += 1
+    pct_template = "".join(parts)
+    return lambda *args: pct_template % args[:n_fields]
+
+
+def _get_html_parser() -> html.HTMLParser:
+    """
+    ### Get the lxml HTML parser of the current thread, it is created on the first call.
+    ---
+    ### Returns:
+    The lxml HTML parser.
+    """
+    parser = getattr(_PARSERS, "html", None)
+    if parser is None:
+        parser = _PARSERS.html = html.HTMLParser(encoding="utf-8")
+    return parser
 
-class MarathonBase(ABC):
+
+def _build_page_urls(
+    fmt: Callable[..., str], pages: list[str], year: str, *fields: str
+) -> list[str]:
+    """
+    ### Build the result URLs of the given pages, only the page number changes between the URLs \
+    so the template is formatted once and each URL is a concatenation of the parts around the page number.
+    ---
+    ### Arguments:
+    - fmt: Formatting function of the URL template (see `_compile_url_template`), the page must be its second field.
+    - pages: The page numbers as strings.
+    - year: year of marathon as string.
+    - *fields: The remaining fields of the template (gender, num_results, ...), the ones the template \
+    does not use are ignored (e.g. the event id of Chicago templates with a fixed event).
+    ---
+    ### Returns:
+    A list with the URL of each page.
+    """
+    marked_url = fmt(year, _PAGE_MARKER, *fields)
+    if marked_url.count(_PAGE_MARKER) != 1:
+        return [fmt(year, page, *fields) for page in pages]
+    head, _, tail = marked_url.partition(_PAGE_MARKER)
+    return [head + page + tail for page in pages]
+
+
+class MarathonBase:
     """
-    ### Abstract base class that implement some shared functionality used by children classes.
+    ### Base class that implement some shared functionality used by children classes.
     """
 
+    # Name of the marathon, used in the printed info and the scraped data file names.
+    name: str
+
+    # Shared pool used to send the men and women requests concurrently.
+    _EXECUTOR: Final[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=2)
+
     def __init__(self, url_template: str = None, split_url_template: str = None):
         """
         ### Construct the marathon object.
@@ -24,654 +130,65 @@ class MarathonBase(ABC):
         else:
             self._BASE_URL: Final[str] = url_template
             self._SPLIT_URL: Final[str] = split_url_template
-
-    @property
-    def url_template(self):
-        return self._BASE_URL
-
-    @url_template.setter
-    def url_template(self, val):
-        raise Exception(
-            "Attempting to change Result URL of the class, if you want to change it reinitialize the object with the new URL (url_template='new_url')."
-        )
-
-    @property
-    def split_url_template(self):
-        return self._SPLIT_URL
-
-    @split_url_template.setter
-    def split_url_template(self, val):
-        raise Exception(
-            "Attempting to change Split URL of the class, if you want to change it reinitialize the object with the new URL (split_url_template='new_url')."
-        )
-
-    @abstractmethod
-    def prepare_res_urls(
-        self,
-        url: str,
-        year: str,
-        pages: list[str],
-        gender: list[str] = ["M", "W"],
-        num_results: str = "25",
-        flat_list: bool = False,
-    ) -> list[list[str], list[str]] | list[str]:
-        """
-        ### Method that creates the marathon results URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - url: URL template to use.
-        - year: year of marathon as string.
-        - pages: A list that must only contain two elements the max pages for Men and Women.
-        - gender: A list of that contains 2 elements M for men and W for women.
-        - num_results: The number of results in a page. (Default 25).
-        - flat_list: A boolean to decided wether to return a single list that contains \
-            all URLs or a list with 2 (men and women) inner URLs list
-        ---
-        ### Returns:
-        #### flat_list == False:
-        A list that contain two lists, the first one has all URLs of the men and the second one contains URLs of the women.
-        #### flat_list == True:
-        A list that contains all URLs for men and women pages.
-        """
-        if len(pages) != 2:
-            raise Exception(
-                " pages should contains exactly 2 elements first element is men max page number and the second one is the women max page number."
-            )
-        men_pages = int(pages[0])
-        women_pages = int(pages[1])
-        max_pages = max(men_pages, women_pages)
-        res_urls = [[], []]
-
-        # for year in years:
-        for page in range(1, max_pages + 1):
-            # Men
-            if page <= men_pages:
-                res_urls[0].append(url.format(year, str(page), gender[0], num_results))
-            # Women
-            if page <= women_pages:
-                res_urls[1].append(url.format(year, str(page), gender[1], num_results))
-        if flat_list:
-            # unpacking the lists into a single list.
-            return list(chain(*res_urls))
-        return res_urls
-
-    @abstractmethod
-    def prepare_split_urls(self, url: str, year: str, idps: list[str]) -> list[str]:
-        """
-        ### Method that create the personal splits URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - url: URL template to use.
-        - year: year of the marathon.
-        - idps: idp of the runner.
-        ---
-        ### Returns:
-        A list that contains all URLs for split page of the runner.
-        """
-        res_list = []
-        for idp in idps:
-            res_list.append(url.format(year, idp))
-        return res_list
-
-    @abstractmethod
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
-        """
-        ### Method to request an HTML page.
-        ---
-        ### Arguments:
-        - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
-        - num_results: The number of results in a page. (Default 25).
-        ---
-        ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
-        """
-        curr_url = self.prepare_res_urls(
-            year=year, pages=pages, num_results=num_results
-        )
-        try:
-            men_res_page = requests.get(curr_url[0][0])
-            women_res_page = requests.get(curr_url[1][0])
-            return (men_res_page, women_res_page)
-        except Exception as e:
-            print(f"Error Occurred: {e}")
-
-    @abstractmethod
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        """
-        ### Create a BeautifulSoup object based on the content of a webpage.
-        ---
-        ### Arguments:
-        - webpage_content: Webpage content such as the one returned by requests module.
-        ---
-        ### Returns:
-        BeautifulSoup object.
-        """
-        return BeautifulSoup(webpage_content, features="lxml")
-
-    @abstractmethod
-    def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
-        """
-        ### Method used for getting the max page number for both men and women result pages.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default 25).
-        ---
-        ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
-        """
-        web_pages = self.request_page(year, pages=["1", "1"], num_results=num_results)
-        men_soup = self.create_soup(webpage_content=web_pages[0].content)
-        women_soup = self.create_soup(webpage_content=web_pages[1].content)
-
-        max_men_pages = men_soup.select('div[class*="pages"] a')[-2].text
-        max_women_pages = women_soup.select('div[class*="pages"] a')[-2].text
-        return (max_men_pages, max_women_pages)
-
-    @abstractmethod
-    def gen_res_scrap_info(
-        self,
-        name: str,
-        year: str,
-        num_results: str,
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Method to generate the URLs for the results pages of a marathon, \
-        the number of URLs dependents on the max pages found in a page with the specified number of results.
-        ---
-        ### Arguments:
-        - name: Name of marathon
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default: 25).
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        _max_pages = self.get_max_pages(year, num_results)
-        print(f"Men Pages: {_max_pages[0]} || Women Pages: {_max_pages[1]}")
-
-        pages_urls = self.prepare_res_urls(
-            year,
-            [_max_pages[0], _max_pages[1]],
-            num_results=num_results,
-            flat_list=True,
+        # Max pages found per (year, num_results), results of finished marathons do not change.
+        self._max_pages_cache: dict[tuple[str, str], tuple[str, str]] = {}
+        # A single session is shared by all requests so keep-alive connections are reused,
+        # responses are cached on disk since the results of past marathons do not change.
+        self._session = requests_cache.CachedSession(
+            "marathons_cache",
+            backend="sqlite",
+            expire_after=timedelta(days=7),
+            allowable_methods=["GET"],
+            # Partial pages (see TAIL_HEADERS) are cached too, matched by their Range header.
+            allowable_codes=[200, 206],
+            match_headers=["Range"],
+            stale_if_error=True,
         )
-        print(f"{name} {year} total results pages: {len(pages_urls)}")
-        print(f"Example URLs: \n {pages_urls[0]} \n {pages_urls[int(_max_pages[0])]}")
-
-        res_settings = get_settings(
-            file_name=f"{name}{year}_res",
-            fields=scraped_fields,
-            _format="csv",
-            overwrite=True,
-            data_path=data_path,
+        self._session.headers.update({"User-Agent": USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
         )
+        # Some of the marathons results websites are still served over http.
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
-        if show_settings:
-            print(f"Settings: \n{res_settings}")
+    def __enter__(self):
+        return self
 
-        return (pages_urls, res_settings)
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-    @abstractmethod
-    def gen_splits_scrap_info(
-        self,
-        name: str,
-        year: str,
-        idps: list[str],
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
+    def close(self) -> None:
         """
-        ### Function to generate the URLs for runners splits pages, based on idps.
-        ---
-        ### Arguments:
-        - name: Name of marathon.
-        - year: The year of marathon.
-        - idps: List of runners ids.
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool, to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
+        ### Close the HTTP session (and its pooled connections) used by the object.
         """
-        splits_urls = self.prepare_split_urls(year, idps)
-
-        split_settings = get_settings(
-            file_name=f"{name}{year}_splits",
-            fields=scraped_fields,
-            _format="csv",
-            overwrite=True,
-            data_path=data_path,
-        )
-
-        print(f"{name} {year} total splits pages: {len(splits_urls)}")
-        print(f"Example URLs: \n {splits_urls[0]} \n {splits_urls[-1]}")
-        if show_settings:
-            print(split_settings)
-
-        return (splits_urls, split_settings)
-
-
-class LondonMarathon(MarathonBase):
-    """
-    ### Class used to gather data of the London marathon which will be used for scraping it.
-    """
+        self._session.close()
 
-    def __init__(
-        self, url_template: str = None, split_url_template: str = None
-    ) -> None:
-        super().__init__(url_template, split_url_template)
-        self.__NAME = "London"
+    @property
+    def url_template(self):
+        return self._BASE_URL
 
-    def prepare_res_urls(
-        self,
-        year: str,
-        pages: list[str],
-        gender: list[str] = ["M", "W"],
-        num_results: str = "25",
-        flat_list: bool = False,
-    ) -> list[list[str], list[str]]:
-        """
-        ### Method that creates the marathon results URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - year: year of marathon as string.
-        - pages: A list that must only contain two elements the max pages for Men and Women.
-        - gender: A list of that contains 2 elements M for men and W for women.
-        - num_results: The number of results in a page. (Default 25).
-        - flat_list: A boolean to decided wether to return a single list that contains \
-            all URLs or a list with 2 (men and women) inner URLs list
-        ---
-        ### Returns:
-        #### flat_list == False:
-        A list that contain two lists, the first one has all URLs of the men and the second one contains URLs of the women.
-        #### flat_list == True:
-        A list that contains all URLs for men and women pages.
-        """
-        return super().prepare_res_urls(
-            self.url_template, year, pages, gender, num_results, flat_list
+    @url_template.setter
+    def url_template(self, val):
+        raise Exception(
+            "Attempting to change Result URL of the class, if you want to change it reinitialize the object with the new URL (url_template='new_url')."
         )
 
-    def prepare_split_urls(self, year: str, idps: list[str]) -> list[str]:
-        """
-        ### Method that create the personal splits URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - year: year of the marathon.
-        - idps: idp of the runner.
-        ---
-        ### Returns:
-        A list that contains all URLs for split page of the runner.
-        """
-        return super().prepare_split_urls(self.split_url_template, year, idps)
-
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
-        """
-        ### Method to request an HTML page.
-        ---
-        ### Arguments:
-        - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
-        - num_results: The number of results in a page. (Default 25).
-        ---
-        ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
-        """
-        return super().request_page(year, pages, num_results)
-
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        return super().create_soup(webpage_content)
-
-    def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
-        """
-        ### Method used for getting the max page number for both men and women result pages.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default 25).
-        ---
-        ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
-        """
-        return super().get_max_pages(year, num_results)
-
-    def gen_res_scrap_info(
-        self,
-        year: str,
-        num_results: str,
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Method to generate the URLs for the results pages of a marathon, \
-        the number of URLs dependents on the max pages found in a page with the specified number of results.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default: 25).
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_res_scrap_info(
-            self.__NAME, year, num_results, scraped_fields, data_path, show_settings
-        )
-
-    def gen_splits_scrap_info(
-        self,
-        year: str,
-        idps: list[str],
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Function to generate the URLs for runners splits pages, based on idps.
-        ---
-        ### Arguments:
-        - year: The year of marathon.
-        - idps: List of runners ids.
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool, to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_splits_scrap_info(
-            self.__NAME, year, idps, scraped_fields, data_path, show_settings
-        )
-
-
-class HamburgMarathon(MarathonBase):
-    """
-    Class used to gather data of the Hamburg marathon which will be used for scraping it.
-    """
-
-    def __init__(
-        self, url_template: str = None, split_url_template: str = None
-    ) -> None:
-        super().__init__(url_template, split_url_template)
-        self.__NAME = "Hamburg"
-
-    def prepare_res_urls(
-        self,
-        year: str,
-        pages: list[str],
-        gender: list[str] = ["M", "W"],
-        num_results: str = "25",
-        flat_list: bool = False,
-    ) -> list[list[str], list[str]]:
-        """
-        ### Method that creates the marathon results URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - year: year of marathon as string.
-        - pages: A list that must only contain two elements the max pages for Men and Women.
-        - gender: A list of that contains 2 elements M for men and W for women.
-        - num_results: The number of results in a page. (Default 25).
-        - flat_list: A boolean to decided wether to return a single list that contains \
-            all URLs or a list with 2 (men and women) inner URLs list
-        ---
-        ### Returns:
-        #### flat_list == False:
-        A list that contain two lists, the first one has all URLs of the men and the second one contains URLs of the women.
-        #### flat_list == True:
-        A list that contains all URLs for men and women pages.
-        """
-        return super().prepare_res_urls(
-            self.url_template, year, pages, gender, num_results, flat_list
-        )
-
-    def prepare_split_urls(self, year: str, idps: list[str]) -> list[str]:
-        """
-        ### Method that create the personal splits URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - year: year of the marathon.
-        - idps: idp of the runner.
-        ---
-        ### Returns:
-        A list that contains all URLs for split page of the runner.
-        """
-        return super().prepare_split_urls(self.split_url_template, year, idps)
-
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
-        """
-        ### Method to request an HTML page.
-        ---
-        ### Arguments:
-        - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
-        - num_results: The number of results in a page. (Default 25).
-        ---
-        ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
-        """
-        return super().request_page(year, pages, num_results)
-
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        return super().create_soup(webpage_content)
-
-    def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
-        """
-        ### Method used for getting the max page number for both men and women result pages.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default 25).
-        ---
-        ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
-        """
-        return super().get_max_pages(year, num_results)
-
-    def gen_res_scrap_info(
-        self,
-        year: str,
-        num_results: str,
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Method to generate the URLs for the results pages of a marathon, \
-        the number of URLs dependents on the max pages found in a page with the specified number of results.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default: 25).
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_res_scrap_info(
-            self.__NAME, year, num_results, scraped_fields, data_path, show_settings
-        )
-
-    def gen_splits_scrap_info(
-        self,
-        year: str,
-        idps: list[str],
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Function to generate the URLs for runners splits pages, based on idps.
-        ---
-        ### Arguments:
-        - year: The year of marathon.
-        - idps: List of runners ids.
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool, to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_splits_scrap_info(
-            self.__NAME, year, idps, scraped_fields, data_path, show_settings
-        )
-
-
-class HoustonMarathon(MarathonBase):
-    """
-    ### Class used to gather data of the Houston marathon which will be used for scraping it.
-    """
-
-    def __init__(
-        self, url_template: str = None, split_url_template: str = None
-    ) -> None:
-        super().__init__(url_template, split_url_template)
-        self.__NAME = "Houston"
-
-    def prepare_res_urls(
-        self,
-        year: str,
-        pages: list[str],
-        gender: list[str] = ["M", "W"],
-        num_results: str = "25",
-        flat_list: bool = False,
-    ) -> list[list[str], list[str]]:
-        """
-        ### Method that creates the marathon results URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - year: year of marathon as string.
-        - pages: A list that must only contain two elements the max pages for Men and Women.
-        - gender: A list of that contains 2 elements M for men and W for women.
-        - num_results: The number of results in a page. (Default 25).
-        - flat_list: A boolean to decided wether to return a single list that contains \
-            all URLs or a list with 2 (men and women) inner URLs list
-        ---
-        ### Returns:
-        #### flat_list == False:
-        A list that contain two lists, the first one has all URLs of the men and the second one contains URLs of the women.
-        #### flat_list == True:
-        A list that contains all URLs for men and women pages.
-        """
-        return super().prepare_res_urls(
-            self.url_template, year, pages, gender, num_results, flat_list
-        )
-
-    def prepare_split_urls(self, year: str, idps: list[str]) -> list[str]:
-        """
-        ### Method that create the personal splits URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        - year: year of the marathon.
-        - idps: idp of the runner.
-        ---
-        ### Returns:
-        A list that contains all URLs for split page of the runner.
-        """
-        return super().prepare_split_urls(self.split_url_template, year, idps)
-
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
-        """
-        ### Method to request an HTML page.
-        ---
-        ### Arguments:
-        - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
-        - num_results: The number of results in a page. (Default 25).
-        ---
-        ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
-        """
-        return super().request_page(year, pages, num_results)
-
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        return super().create_soup(webpage_content)
-
-    def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
-        """
-        ### Method used for getting the max page number for both men and women result pages.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default 25).
-        ---
-        ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
-        """
-        return super().get_max_pages(year, num_results)
-
-    def gen_res_scrap_info(
-        self,
-        year: str,
-        num_results: str,
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Method to generate the URLs for the results pages of a marathon, \
-        the number of URLs dependents on the max pages found in a page with the specified number of results.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default: 25).
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_res_scrap_info(
-            self.__NAME, year, num_results, scraped_fields, data_path, show_settings
-        )
-
-    def gen_splits_scrap_info(
-        self,
-        year: str,
-        idps: list[str],
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
-        """
-        ### Function to generate the URLs for runners splits pages, based on idps.
-        ---
-        ### Arguments:
-        - year: The year of marathon.
-        - idps: List of runners ids.
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool, to print the settings created (Default: False).
-        ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_splits_scrap_info(
-            self.__NAME, year, idps, scraped_fields, data_path, show_settings
-        )
-
-
-class StockHolmMarathon(MarathonBase):
-    """
-    ### Class used to gather data of the Stockholm marathon which will be used for scraping it.
-    """
-
-    def __init__(
-        self, url_template: str = None, split_url_template: str = None
-    ) -> None:
-        super().__init__(url_template, split_url_template)
-        self.__NAME = "Stockholm"
+    @property
+    def split_url_template(self):
+        return self._SPLIT_URL
+
+    @split_url_template.setter
+    def split_url_template(self, val):
+        raise Exception(
+            "Attempting to change Split URL of the class, if you want to change it reinitialize the object with the new URL (split_url_template='new_url')."
+        )
 
     def prepare_res_urls(
         self,
@@ -680,7 +197,7 @@ class StockHolmMarathon(MarathonBase):
         gender: list[str] = ["M", "W"],
         num_results: str = "25",
         flat_list: bool = False,
-    ) -> list[list[str], list[str]]:
+    ) -> list[list[str], list[str]] | list[str]:
         """
         ### Method that creates the marathon results URLs needed based on the years and pages lists.
         ---
@@ -698,9 +215,25 @@ class StockHolmMarathon(MarathonBase):
         #### flat_list == True:
         A list that contains all URLs for men and women pages.
         """
-        return super().prepare_res_urls(
-            self.url_template, year, pages, gender, num_results, flat_list
+        if len(pages) != 2:
+            raise Exception(
+                " pages should contains exactly 2 elements first element is men max page number and the second one is the women max page number."
+            )
+        men_pages = int(pages[0])
+        women_pages = int(pages[1])
+        fmt = _compile_url_template(self._BASE_URL)
+        # Page numbers are converted to string once and shared by men and women URLs.
+        pages_str = list(map(str, range(1, max(men_pages, women_pages) + 1)))
+
+        men_urls = _build_page_urls(
+            fmt, pages_str[:men_pages], year, gender[0], num_results
         )
+        women_urls = _build_page_urls(
+            fmt, pages_str[:women_pages], year, gender[1], num_results
+        )
+        if flat_list:
+            return men_urls + women_urls
+        return [men_urls, women_urls]
 
     def prepare_split_urls(self, year: str, idps: list[str]) -> list[str]:
         """
@@ -713,160 +246,207 @@ class StockHolmMarathon(MarathonBase):
         ### Returns:
         A list that contains all URLs for split page of the runner.
         """
-        return super().prepare_split_urls(self.split_url_template, year, idps)
+        fmt = _compile_url_template(self._SPLIT_URL)
+        return [fmt(year, idp) for idp in idps]
 
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
+    def _first_page_urls(self, year: str, num_results: str = "25") -> tuple[str, str]:
         """
-        ### Method to request an HTML page.
+        ### Method that creates the URLs of the first results page for men and women.
         ---
         ### Arguments:
         - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
         - num_results: The number of results in a page. (Default 25).
         ---
         ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
+        A tuple with the men and women first page URLs.
         """
-        return super().request_page(year, pages, num_results)
-
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        return super().create_soup(webpage_content)
+        fmt = _compile_url_template(self._BASE_URL)
+        return fmt(year, "1", "M", num_results), fmt(year, "1", "W", num_results)
 
-    def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
+    def request_page(
+        self,
+        year: str = None,
+        pages: list[str] = None,
+        num_results: str = "25",
+        headers: dict[str, str] = None,
+    ) -> tuple[requests.models.Response, requests.models.Response]:
         """
-        ### Method used for getting the max page number for both men and women result pages.
+        ### Method to request an HTML page.
         ---
         ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default 25).
+        - year: The year of the marathon.
+        - pages: Not used, kept for compatibility; only the first page of men and women is requested.
+        - num_results: The number of results in a page. (Default 25).
+        - headers: Extra HTTP headers to send with the requests (Default: None).
         ---
-        ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
+        ### Returns:
+        A tuple with two elements, the first contain the men webpage and the second contains the women webpage, \
+        raises MarathonFetchError if one of the requests fails.
         """
-        return super().get_max_pages(year, num_results)
+        men_url, women_url = self._first_page_urls(year, num_results)
+        try:
+            men_res_page = self._EXECUTOR.submit(
+                self._session.get,
+                men_url,
+                timeout=REQUEST_TIMEOUT,
+                headers=headers,
+            )
+            women_res_page = self._EXECUTOR.submit(
+                self._session.get,
+                women_url,
+                timeout=REQUEST_TIMEOUT,
+                headers=headers,
+            )
+            return (men_res_page.result(), women_res_page.result())
+        except requests.RequestException as e:
+            raise MarathonFetchError(
+                f"Failed to request {self.name} {year} results page: {e}"
+            ) from e
 
-    def gen_res_scrap_info(
-        self,
-        year: str,
-        num_results: str,
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
+    async def request_pages_async(
+        self, urls: list[str], concurrency: int = 20, return_exceptions: bool = False
+    ) -> list[bytes | Exception]:
         """
-        ### Method to generate the URLs for the results pages of a marathon, \
-        the number of URLs dependents on the max pages found in a page with the specified number of results.
+        ### Coroutine to request many HTML pages concurrently.
         ---
         ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default: 25).
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool to print the settings created (Default: False).
+        - urls: A list of URLs to request (e.g. the ones returned by `prepare_res_urls` with flat_list=True).
+        - concurrency: The max number of requests sent at the same time (Default 20).
+        - return_exceptions: Bool, to return the error of a failed page in its place instead of raising it (Default: False).
         ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
-        """
-        return super().gen_res_scrap_info(
-            self.__NAME, year, num_results, scraped_fields, data_path, show_settings
+        ### Returns:
+        A list with the content of each page, in the same order as `urls`.
+        """
+        sem = asyncio.BoundedSemaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=15)
+        # All the pages of a marathon are on the same host, so the connections are kept alive and reused.
+        connector = aiohttp.TCPConnector(
+            limit=concurrency,
+            limit_per_host=concurrency,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
         )
 
-    def gen_splits_scrap_info(
-        self,
-        year: str,
-        idps: list[str],
-        scraped_fields: list[str],
-        data_path: str,
-        show_settings: bool = False,
-    ) -> tuple[list[str], dict]:
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+        ) as session:
+
+            async def fetch(url: str) -> bytes:
+                async with sem, session.get(url) as res:
+                    res.raise_for_status()
+                    return await res.read()
+
+            return await asyncio.gather(
+                *[fetch(url) for url in urls], return_exceptions=return_exceptions
+            )
+
+    def request_pages(
+        self, urls: list[str], concurrency: int = 20, return_exceptions: bool = False
+    ) -> list[bytes | Exception]:
         """
-        ### Function to generate the URLs for runners splits pages, based on idps.
+        ### Method to request many HTML pages concurrently (sync wrapper of `request_pages_async`).
         ---
         ### Arguments:
-        - year: The year of marathon.
-        - idps: List of runners ids.
-        - scraped_fields: The fields which will be saved from the scraped data.
-        - data_path: The path to save the scraped data file.
-        - show_settings: Bool, to print the settings created (Default: False).
+        - urls: A list of URLs to request.
+        - concurrency: The max number of requests sent at the same time (Default 20).
+        - return_exceptions: Bool, to return the error of a failed page in its place instead of raising it (Default: False).
         ---
-        ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
+        ### Returns:
+        A list with the content of each page, in the same order as `urls`.
         """
-        return super().gen_splits_scrap_info(
-            self.__NAME, year, idps, scraped_fields, data_path, show_settings
-        )
-
-
-class BostonMarathon(MarathonBase):
-    """
-    ### Class used to gather data of the Boston marathon which will be used for scraping it.
-    """
-
-    def __init__(
-        self, url_template: str = None, split_url_template: str = None
-    ) -> None:
-        super().__init__(url_template, split_url_template)
-        self.__NAME = "Boston"
+        coro = self.request_pages_async(urls, concurrency, return_exceptions)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # An event loop is already running (e.g. Jupyter), so run it in another thread.
+        return self._EXECUTOR.submit(asyncio.run, coro).result()
 
-    def prepare_res_urls(
-        self,
-        year: str,
-        pages: list[str],
-        gender: list[str] = ["M", "W"],
-        num_results: str = "25",
-        flat_list: bool = False,
-    ) -> list[list[str], list[str]]:
+    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
         """
-        ### Method that creates the marathon results URLs needed based on the years and pages lists.
+        ### Create a BeautifulSoup object based on the content of a webpage \
+        (`get_max_pages` uses the lighter `create_tree`).
         ---
         ### Arguments:
-        - year: year of marathon as string.
-        - pages: A list that must only contain two elements the max pages for Men and Women.
-        - gender: A list of that contains 2 elements M for men and W for women.
-        - num_results: The number of results in a page. (Default 25).
-        - flat_list: A boolean to decided wether to return a single list that contains \
-            all URLs or a list with 2 (men and women) inner URLs list
+        - webpage_content: Webpage content such as the one returned by requests module.
         ---
         ### Returns:
-        #### flat_list == False:
-        A list that contain two lists, the first one has all URLs of the men and the second one contains URLs of the women.
-        #### flat_list == True:
-        A list that contains all URLs for men and women pages.
+        BeautifulSoup object.
         """
-        return super().prepare_res_urls(
-            self.url_template, year, pages, gender, num_results, flat_list
+        # The result pages are utf-8, giving the encoding skips the detection step.
+        return BeautifulSoup(
+            webpage_content,
+            features="lxml",
+            from_encoding="utf-8",
+            multi_valued_attributes=None,
         )
 
-    def prepare_split_urls(self, year: str, idps: list[str]) -> list[str]:
+    def create_tree(self, webpage_content: bytes) -> html.HtmlElement:
         """
-        ### Method that create the personal splits URLs needed based on the years and pages lists.
+        ### Create an lxml HTML tree based on the content of a webpage, lighter than `create_soup` \
+        since no python wrapper objects are created for the elements, it is used by `get_max_pages` to read the pagination.
         ---
         ### Arguments:
-        - year: year of the marathon.
-        - idps: idp of the runner.
+        - webpage_content: Webpage content such as the one returned by requests module.
         ---
         ### Returns:
-        A list that contains all URLs for split page of the runner.
+        The root element of the lxml tree, or the parsed element(s) if the content is only a part \
+        of a page (e.g. the end of the page requested with TAIL_HEADERS).
         """
-        return super().prepare_split_urls(self.split_url_template, year, idps)
+        return html.fromstring(webpage_content, parser=_get_html_parser())
 
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
+    def _parse_max_page(self, webpage_content: bytes) -> str | None:
         """
-        ### Method to request an HTML page.
+        ### Read the max page number from the content of a result page (or only the end of it).
         ---
         ### Arguments:
-        - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
-        - num_results: The number of results in a page. (Default 25).
+        - webpage_content: Webpage content such as the one returned by requests module.
         ---
         ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
+        The text of the second to last link of the pagination div (the last one is the "next" arrow), \
+        None if the pagination div is not found.
         """
-        return super().request_page(year, pages, num_results)
+        try:
+            tree = self.create_tree(webpage_content)
+        except etree.ParserError:
+            # The content is empty or only has whitespace, comments or closing tags.
+            return None
+        pages_links = _PAGES_LINKS_XPATH(tree)
+        return pages_links[-2].text_content() if len(pages_links) >= 2 else None
 
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        return super().create_soup(webpage_content)
+    def _read_max_page(self, response: requests.models.Response) -> str:
+        """
+        ### Read the max page number from a result page response, if the response only contains \
+        the end of the page and the pagination is not in it, the full page is requested.
+        ---
+        ### Arguments:
+        - response: A result page response.
+        ---
+        ### Returns: The max page number, raises MarathonFetchError if the page could not be requested \
+        (including an HTTP error status).
+        """
+        try:
+            response.raise_for_status()
+            max_page = self._parse_max_page(response.content)
+            if max_page is None and response.status_code == 206:
+                full_page = self._session.get(response.url, timeout=REQUEST_TIMEOUT)
+                full_page.raise_for_status()
+                max_page = self._parse_max_page(full_page.content)
+        except requests.RequestException as e:
+            raise MarathonFetchError(
+                f"Failed to request {self.name} results page: {e}"
+            ) from e
+        if max_page is None:
+            raise ValueError(f"Pagination not found in {response.url}")
+        # The link text can be surrounded by whitespace.
+        max_page = max_page.strip()
+        if not max_page.isdigit():
+            raise ValueError(
+                f"Unexpected max page number '{max_page}' found in {response.url}"
+            )
+        return max_page
 
     def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
         """
@@ -878,7 +458,21 @@ class BostonMarathon(MarathonBase):
         ---
         ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
         """
-        return super().get_max_pages(year, num_results)
+        key = (year, num_results)
+        if key in self._max_pages_cache:
+            return self._max_pages_cache[key]
+
+        # Only the end of the pages is requested, the pagination is at the bottom of the page.
+        web_pages = self.request_page(
+            year,
+            pages=["1", "1"],
+            num_results=num_results,
+            headers=TAIL_HEADERS,
+        )
+        max_men_pages = self._read_max_page(web_pages[0])
+        max_women_pages = self._read_max_page(web_pages[1])
+        self._max_pages_cache[key] = (max_men_pages, max_women_pages)
+        return self._max_pages_cache[key]
 
     def gen_res_scrap_info(
         self,
@@ -901,10 +495,31 @@ class BostonMarathon(MarathonBase):
         ---
         ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
         """
-        return super().gen_res_scrap_info(
-            self.__NAME, year, num_results, scraped_fields, data_path, show_settings
+        _max_pages = self.get_max_pages(year, num_results)
+        print(f"Men Pages: {_max_pages[0]} || Women Pages: {_max_pages[1]}")
+
+        pages_urls = self.prepare_res_urls(
+            year,
+            [_max_pages[0], _max_pages[1]],
+            num_results=num_results,
+            flat_list=True,
+        )
+        print(f"{self.name} {year} total results pages: {len(pages_urls)}")
+        print(f"Example URLs: \n {pages_urls[0]} \n {pages_urls[int(_max_pages[0])]}")
+
+        res_settings = get_settings(
+            file_name=f"{self.name}{year}_res",
+            fields=scraped_fields,
+            _format="csv",
+            overwrite=True,
+            data_path=data_path,
         )
 
+        if show_settings:
+            print(f"Settings: \n{res_settings}")
+
+        return (pages_urls, res_settings)
+
     def gen_splits_scrap_info(
         self,
         year: str,
@@ -925,16 +540,91 @@ class BostonMarathon(MarathonBase):
         ---
         ### Returns: A tuple with 2 elements, the first is a list of URLs while the second is dictionary of settings.
         """
-        return super().gen_splits_scrap_info(
-            self.__NAME, year, idps, scraped_fields, data_path, show_settings
+        splits_urls = self.prepare_split_urls(year, idps)
+
+        split_settings = get_settings(
+            file_name=f"{self.name}{year}_splits",
+            fields=scraped_fields,
+            _format="csv",
+            overwrite=True,
+            data_path=data_path,
         )
 
+        print(f"{self.name} {year} total splits pages: {len(splits_urls)}")
+        print(f"Example URLs: \n {splits_urls[0]} \n {splits_urls[-1]}")
+        if show_settings:
+            print(split_settings)
+
+        return (splits_urls, split_settings)
+
+
+class Marathon(MarathonBase):
+    """
+    ### Class used to gather data of a marathon which will be used for scraping it.
+    """
+
+    def __init__(
+        self, name: str, url_template: str = None, split_url_template: str = None
+    ) -> None:
+        """
+        ### Construct the marathon object.
+        ---
+        ### Arguments:
+        - name: Name of the marathon, used in the printed info and the scraped data file names.
+        - url_template: The base URL template of the marathon result page.
+        - split_url_template: The base URL of the runners splits page.
+        """
+        super().__init__(url_template, split_url_template)
+        self.name = name
+
+
+class LondonMarathon(MarathonBase):
+    """
+    ### Class used to gather data of the London marathon which will be used for scraping it.
+    """
+
+    name = "London"
+
+
+class HamburgMarathon(MarathonBase):
+    """
+    Class used to gather data of the Hamburg marathon which will be used for scraping it.
+    """
+
+    name = "Hamburg"
+
+
+class HoustonMarathon(MarathonBase):
+    """
+    ### Class used to gather data of the Houston marathon which will be used for scraping it.
+    """
+
+    name = "Houston"
+
+
+class StockHolmMarathon(MarathonBase):
+    """
+    ### Class used to gather data of the Stockholm marathon which will be used for scraping it.
+    """
+
+    name = "Stockholm"
+
+
+class BostonMarathon(MarathonBase):
+    """
+    ### Class used to gather data of the Boston marathon which will be used for scraping it.
+    """
+
+    name = "Boston"
+
 
 class ChicagoMarathon(MarathonBase):
     """
     ### Class used to gather data of the Chicago marathon which will be used for scraping it.
     """
 
+    name = "Chicago"
+
     def __init__(
         self,
         url_template: str = None,
@@ -942,7 +632,6 @@ class ChicagoMarathon(MarathonBase):
         event_id: str = None,
     ):
         super().__init__(url_template, split_url_template)
-        self.__NAME = "Chicago"
         self.event_id = event_id
 
     def prepare_res_urls(
@@ -978,80 +667,36 @@ class ChicagoMarathon(MarathonBase):
             )
         men_pages = int(pages[0])
         women_pages = int(pages[1])
-        max_pages = max(men_pages, women_pages)
-        res_urls = [[], []]
-
-        # for year in years:
-        for page in range(1, max_pages + 1):
-            # Men
-            if page <= men_pages:
-                res_urls[0].append(
-                    self.url_template.format(
-                        year, str(page), gender[0], num_results, event_id
-                    )
-                )
-            # Women
-            if page <= women_pages:
-                res_urls[1].append(
-                    self.url_template.format(
-                        year, str(page), gender[1], num_results, event_id
-                    )
-                )
-        if flat_list:
-            # unpacking the lists into a single list.
-            return list(chain(*res_urls))
-        return res_urls
+        fmt = _compile_url_template(self._BASE_URL)
+        # Page numbers are converted to string once and shared by men and women URLs.
+        pages_str = list(map(str, range(1, max(men_pages, women_pages) + 1)))
 
-    def prepare_split_urls(self, year: str, idps: list[str]) -> list[str]:
-        """
-        ### Method that create the personal splits URLs needed based on the years and pages lists.
-        ---
-        ### Arguments:
-        -
-        ---
-        ### Returns:
-        A list that contains all URLs for split page of the runner.
-        """
-        return super().prepare_split_urls(self.split_url_template, year, idps)
+        men_urls = _build_page_urls(
+            fmt, pages_str[:men_pages], year, gender[0], num_results, event_id
+        )
+        women_urls = _build_page_urls(
+            fmt, pages_str[:women_pages], year, gender[1], num_results, event_id
+        )
+        if flat_list:
+            return men_urls + women_urls
+        return [men_urls, women_urls]
 
-    def request_page(
-        self, year: str = None, pages: list[str] = None, num_results: str = "25"
-    ) -> tuple[requests.models.Response, requests.models.Response]:
+    def _first_page_urls(self, year: str, num_results: str = "25") -> tuple[str, str]:
         """
-        ### Method to request an HTML page.
+        ### Method that creates the URLs of the first results page for men and women.
         ---
         ### Arguments:
         - year: The year of the marathon.
-        - page: A list that must only contain two elements the max pages for Men and Women.
         - num_results: The number of results in a page. (Default 25).
         ---
         ### Returns:
-        A tuple with two elements, the first contain the men webpage and the second contains the women webpage.
+        A tuple with the men and women first page URLs.
         """
-        curr_url = self.prepare_res_urls(
-            year=year, pages=pages, event_id=self.event_id, num_results=num_results
+        fmt = _compile_url_template(self._BASE_URL)
+        return (
+            fmt(year, "1", "M", num_results, self.event_id),
+            fmt(year, "1", "W", num_results, self.event_id),
         )
-        try:
-            men_res_page = requests.get(curr_url[0][0])
-            women_res_page = requests.get(curr_url[1][0])
-            return (men_res_page, women_res_page)
-        except Exception as e:
-            print(f"Error Occurred: {e}")
-
-    def create_soup(self, webpage_content: bytes) -> BeautifulSoup:
-        return super().create_soup(webpage_content)
-
-    def get_max_pages(self, year: str, num_results: str = "25") -> list[str]:
-        """
-        ### Method used for getting the max page number for both men and women result pages.
-        ---
-        ### Arguments:
-        - year: The year of marathon
-        - num_results: The number of results to be displayed per page (Default 25).
-        ---
-        ### Returns: A list with 2 elements, the first and second is max page number for men and women respectively.
-        """
-        return super().get_max_pages(year, num_results)
 
     def gen_res_scrap_info(
         self,
@@ -1084,12 +729,12 @@ class ChicagoMarathon(MarathonBase):
             num_results=num_results,
             flat_list=True,
         )
-        print(f"{self.__NAME} {year} total results pages: {len(pages_urls)}")
+        print(f"{self.name} {year} total results pages: {len(pages_urls)}")
         print(f"Example URLs: \n {pages_urls[0]} \n {pages_urls[int(_max_pages[0])]}")
 
         # Spider settings.
         res_settings = get_settings(
-            file_name=f"{self.__NAME}{year}_res",
+            file_name=f"{self.name}{year}_res",
             fields=scraped_fields,
             _format="csv",
             overwrite=True,
@@ -1129,16 +774,27 @@ class ChicagoMarathon(MarathonBase):
             splits_urls = self.prepare_split_urls(year, idps)
 
         split_settings = get_settings(
-            file_name=f"{self.__NAME}{year}_splits",
+            file_name=f"{self.name}{year}_splits",
             fields=scraped_fields,
             _format="csv",
             overwrite=True,
             data_path=data_path,
         )
 
-        print(f"{self.__NAME} {year} total splits pages: {len(splits_urls)}")
+        print(f"{self.name} {year} total splits pages: {len(splits_urls)}")
         print(f"Example URLs: \n {splits_urls[0]} \n {splits_urls[-1]}")
         if show_settings:
             print(f"Settings: \n{split_settings}")
 
         return (splits_urls, split_settings)
+
+
+# Marathon classes by marathon name.
+MARATHONS: Final[dict[str, type[MarathonBase]]] = {
+    "London": LondonMarathon,
+    "Hamburg": HamburgMarathon,
+    "Houston": HoustonMarathon,
+    "Stockholm": StockHolmMarathon,
+    "Boston": BostonMarathon,
+    "Chicago": ChicagoMarathon,
+}
@@ -3,130 +3,121 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
 
-import scrapy
-
-
-class MarathonsScrapyItem(scrapy.Item):
+from dataclasses import dataclass
+
+# Keys of the splits in the order they appear in the splits tables.
+SPLIT_KEYS: tuple[str, ...] = (
+    "k_5",
+    "k_10",
+    "k_15",
+    "k_20",
+    "k_half",
+    "k_25",
+    "k_30",
+    "k_35",
+    "k_40",
+    "k_finish",
+)
+# Houston marathon does not provide the 20K split.
+HOUSTON_SPLIT_KEYS: tuple[str, ...] = tuple(key for key in SPLIT_KEYS if key != "k_20")
+
+
+@dataclass(slots=True)
+class MarathonsScrapyItem:
     """
     ### Classes to handle the marathons' data.
     """
 
-    run_no: str = scrapy.Field()
-    age_cat: str = scrapy.Field()
-    gender: str = scrapy.Field()
-    half: str = scrapy.Field()
-    finish: str = scrapy.Field()
-    idp: str = scrapy.Field()
+    run_no: str | None = None
+    age_cat: str | None = None
+    gender: str | None = None
+    half: str | None = None
+    finish: str | None = None
+    idp: str | None = None
 
 
-class MarathonsSplitItem(scrapy.Item):
+@dataclass(slots=True)
+class MarathonsSplitItem:
     """
     ### Classes to handle the marathons' split data.
     """
 
-    race_state: str = scrapy.Field()
-    last_split: str = scrapy.Field()
-    idp: str = scrapy.Field()
-    k_5: list = scrapy.Field()
-    k_10: list = scrapy.Field()
-    k_15: list = scrapy.Field()
-    k_20: list = scrapy.Field()
-    k_half: list = scrapy.Field()
-    k_25: list = scrapy.Field()
-    k_30: list = scrapy.Field()
-    k_35: list = scrapy.Field()
-    k_40: list = scrapy.Field()
-    k_finish: list = scrapy.Field()
+    race_state: str | None = None
+    last_split: str | None = None
+    idp: str | None = None
+    k_5: list | None = None
+    k_10: list | None = None
+    k_15: list | None = None
+    k_20: list | None = None
+    k_half: list | None = None
+    k_25: list | None = None
+    k_30: list | None = None
+    k_35: list | None = None
+    k_40: list | None = None
+    k_finish: list | None = None
 
     @classmethod
-    def get_split_keys(self) -> list[str]:
-        return [
-            "k_5",
-            "k_10",
-            "k_15",
-            "k_20",
-            "k_half",
-            "k_25",
-            "k_30",
-            "k_35",
-            "k_40",
-            "k_finish",
-        ]
+    def get_split_keys(self) -> tuple[str, ...]:
+        return SPLIT_KEYS
 
 
+@dataclass(slots=True)
 class LondonItem(MarathonsScrapyItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class LondonSplitItem(MarathonsSplitItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class HamburgItem(MarathonsScrapyItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class HamburgSplitItem(MarathonsSplitItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class HoustonItem(MarathonsScrapyItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class HoustonSplitItem(MarathonsSplitItem):
-    def __init__(self):
-        super().__init__()
-
     @classmethod
-    def get_split_keys(self) -> list[str]:
-        return [
-            "k_5",
-            "k_10",
-            "k_15",
-            "k_half",
-            "k_25",
-            "k_30",
-            "k_35",
-            "k_40",
-            "k_finish",
-        ]
+    def get_split_keys(self) -> tuple[str, ...]:
+        return HOUSTON_SPLIT_KEYS
 
 
+@dataclass(slots=True)
 class StockholmItem(MarathonsScrapyItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class StockholmSplitItem(MarathonsSplitItem):
-    def __init__(self):
-        super().__init__()
-
-    yob: str = scrapy.Field()
+    yob: str | None = None
 
 
+@dataclass(slots=True)
 class BostonItem(MarathonsScrapyItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class BostonSplitItem(MarathonsSplitItem):
-    def __init__(self):
-        super().__init__()
-
-    age_cat: str = scrapy.Field()
+    age_cat: str | None = None
 
 
+@dataclass(slots=True)
 class ChicagoItem(MarathonsScrapyItem):
-    def __init__(self):
-        super().__init__()
+    pass
 
 
+@dataclass(slots=True)
 class ChicagoSplitItem(MarathonsSplitItem):
-    def __init__(self):
-        super().__init__()
+    pass
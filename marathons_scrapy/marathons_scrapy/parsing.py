@@ -0,0 +1,133 @@
+# Helpers shared by the spiders to parse the marathons' pages.
+
+from lxml import etree
+from scrapy.selector import Selector
+
+# Separator used to join the fields returned by a row XPath (private use character,
+# it never appears in the pages).
+_FIELD_SEPARATOR = "\ue000"
+
+
+def compile_xpath(query: str) -> etree.XPath:
+    """
+    ### Compile an XPath query once so it can be reused for every row of a page.
+    ---
+    ### Arguments:
+    - query: The XPath query, it can use variables (e.g. `$idx`) passed when it is evaluated.
+    ---
+    ### Returns:
+    The compiled XPath, it returns plain strings instead of lxml "smart" strings.
+    """
+    return etree.XPath(query, smart_strings=False)
+
+
+def _get_root(node: Selector | etree._Element) -> etree._Element:
+    """
+    ### Return the lxml element of a selector (elements are returned as they are).
+    """
+    return node.root if isinstance(node, Selector) else node
+
+
+def xpath_first(
+    xpath: etree.XPath, node: Selector | etree._Element, **variables
+) -> str | None:
+    """
+    ### Evaluate a compiled XPath on a selector and return its first result (like `Selector.xpath(...).get()`).
+    ---
+    ### Arguments:
+    - xpath: The compiled XPath (see `compile_xpath`).
+    - node: The selector (or lxml element) to evaluate the XPath from.
+    - variables: Values of the XPath variables.
+    ---
+    ### Returns:
+    The first result of the XPath or None if nothing matched.
+    """
+    results = xpath(_get_root(node), **variables)
+    return results[0] if results else None
+
+
+def compile_row_xpath(*queries: str) -> etree.XPath:
+    """
+    ### Compile several XPath queries into a single XPath, so all the fields of a row are extracted in one evaluation.
+    ---
+    ### Arguments:
+    - queries: The XPath queries of the fields, relative to the row.
+    ---
+    ### Returns:
+    The compiled XPath, to be evaluated with `xpath_row`.
+    """
+    fields = f", '{_FIELD_SEPARATOR}', ".join(f"string({query})" for query in queries)
+    return compile_xpath(f"concat({fields})")
+
+
+def xpath_row(
+    xpath: etree.XPath, node: Selector | etree._Element, **variables
+) -> tuple[str | None, ...]:
+    """
+    ### Evaluate a row XPath (see `compile_row_xpath`) on a selector.
+    ---
+    ### Arguments:
+    - xpath: The compiled row XPath.
+    - node: The selector (or lxml element) of the row.
+    - variables: Values of the XPath variables.
+    ---
+    ### Returns:
+    A tuple with the first result of each query, in the same order as the queries, \
+    None for the queries that did not match anything.
+    """
+    values = xpath(_get_root(node), **variables).split(_FIELD_SEPARATOR)
+    return tuple(value or None for value in values)
+
+
+# XPath of the runners in the results pages that list them (evaluated on `response.selector.root`).
+RESULTS_LIST_XPATH = compile_xpath('//li[contains(@class, " list-group-item row")]')
+# XPath of the runners in the results pages that use a table, skipping the table header.
+RESULTS_TABLE_XPATH = compile_xpath("(//tr)[position() > 1]")
+# XPath of the (time, pace, speed) cells of a row in the splits table used by most of the websites.
+SPLIT_ROW_XPATH = compile_row_xpath("td[2]/text()", "td[4]/text()", "td[5]/text()")
+# XPath of the rows of the splits table (the spiders skip its header rows).
+SPLITS_TABLE_XPATH = compile_xpath('//div[@class="detail-box box-splits"]//tr')
+# XPath of the runner's (race_state, last_split) in the split result pages.
+RACE_STATE_XPATH = compile_row_xpath(
+    '//div[@class="detail-box box-state"]//tr[1]/td/text()',
+    '//div[@class="detail-box box-state"]//tr[2]/td/text()',
+)
+
+
+def get_idp(url: str) -> str:
+    """
+    ### Extract the runner id (`idp` query parameter) from a results or splits page URL.
+    ---
+    ### Arguments:
+    - url: The URL (or href) containing the idp parameter.
+    ---
+    ### Returns:
+    The idp of the runner.
+    """
+    return url.partition("idp=")[2].partition("&")[0]
+
+
+def get_gender(url: str) -> str:
+    """
+    ### Extract the gender (the character before the `num` query parameter) from a results page URL.
+    ---
+    ### Arguments:
+    - url: The URL of the results page.
+    ---
+    ### Returns:
+    The gender of the runners of the page (e.g. M or W).
+    """
+    return url.partition("&num")[0][-1]
+
+
+def is_estimated(split: Selector | etree._Element) -> bool:
+    """
+    ### Check if the time of a split row was estimated by the website (`estimated` in its class).
+    ---
+    ### Arguments:
+    - split: The selector (or lxml element) of the split row.
+    ---
+    ### Returns:
+    True if the split time is estimated.
+    """
+    return "estimated" in _get_root(split).get("class", "")
@@ -0,0 +1,54 @@
+import scrapy
+from lxml import etree
+from ..parsing import xpath_row, get_idp, get_gender
+
+
+class MarathonSpider(scrapy.Spider):
+    """
+    ### Base class of the marathons' spiders, it requests the given URLs and sends the responses to `parse` \
+    (main result pages) or `parse_split` (split result pages).
+    """
+
+    # XPath of the runners in the main result pages (e.g. `RESULTS_LIST_XPATH`).
+    RUNNERS_XPATH: etree.XPath
+    # Row XPath of the runner's fields (see `compile_row_xpath`), its last query is the href of the splits page.
+    ROW_XPATH: etree.XPath
+    # Item fields of the values returned by `ROW_XPATH` (without the href), in the same order.
+    ROW_FIELDS: tuple[str, ...]
+    # Item class of the main result pages.
+    ITEM_CLS: type
+
+    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
+        self.urls: list[str] = urls
+        self.splits: bool = splits
+        super().__init__()
+
+    def start_requests(self):
+        callback = self.parse_split if self.splits else self.parse
+        for url in self.urls:
+            yield scrapy.Request(url=url, callback=callback)
+
+    def row_xpath_variables(self) -> dict[str, int]:
+        """
+        ### Values of the variables used by `ROW_XPATH` (e.g. `$idx`), none by default.
+        """
+        return {}
+
+    def parse(self, response):
+        """
+        ### Parse the main result pages.
+        """
+        runners = self.RUNNERS_XPATH(response.selector.root)
+        # The gender is the same for every runner of the page.
+        gender = get_gender(response.url)
+        row_xpath = self.ROW_XPATH
+        fields = self.ROW_FIELDS
+        item_cls = self.ITEM_CLS
+        variables = self.row_xpath_variables()
+        items = []
+        for runner in runners:
+            *values, href = xpath_row(row_xpath, runner, **variables)
+            items.append(
+                item_cls(gender=gender, idp=get_idp(href), **dict(zip(fields, values)))
+            )
+        return items
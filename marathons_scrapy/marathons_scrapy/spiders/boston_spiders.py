@@ -1,131 +1,125 @@
 import scrapy
 from ..items import BostonItem, BostonSplitItem
-import logging
+from .base_spider import MarathonSpider
+from ..parsing import (
+    compile_xpath,
+    xpath_first,
+    compile_row_xpath,
+    xpath_row,
+    get_idp,
+    SPLIT_ROW_XPATH,
+    RESULTS_LIST_XPATH,
+    SPLITS_TABLE_XPATH,
+    RACE_STATE_XPATH,
+    RESULTS_TABLE_XPATH,
+    is_estimated,
+)
+from itertools import islice
 import re
 
-
-class Boston1417(scrapy.Spider):
+# Patterns are compiled once at import time.
+_AGE_RE = re.compile(r"\d{2}(?:-\d{2}|\+)")
+_YEAR_RE = re.compile(r"(?<=/)\d{4}(?=/)")
+# XPath of the runners' fields (run_no, finish, href) in the results table (2014 - 2017).
+_ROW_1417_XPATH = compile_row_xpath("td[5]/text()", "td[7]/text()", "td[4]/a/@href")
+# XPath of the runners' fields (run_no, finish, href) in the results list (2018 - 2023).
+_ROW_1823_XPATH = compile_row_xpath(
+    './/div[@class="pull-left"]/div/div[$idx]/text()',
+    './/div[@class="pull-right"]/div/div[2]/text()',
+    ".//h4/a/@href",
+)
+# XPath of the runner's age group in the split result pages.
+_AGE_GROUP_XPATH = compile_xpath(
+    '//div[@class="detail-box box-general"]//tr[3]/td/text()'
+)
+# XPath of the name of a split (first column of the splits table).
+_SPLIT_NAME_XPATH = compile_xpath("th/text()")
+# Names of the splits kept from the splits table (2018 - 2023), the extra splits in miles are skipped.
+SPLITS_NAMES: frozenset[str] = frozenset(
+    {
+        "5K",
+        "10K",
+        "15K",
+        "20K",
+        "HALF",
+        "25K",
+        "30K",
+        "35K",
+        "40K",
+        "Finish Net",
+    }
+)
+
+
+class Boston1417(MarathonSpider):
     """
     ### Scrapy spider used to scrap Boston marathon data between 2014 - 2017
     """
 
     name = "boston14_17"
+    RUNNERS_XPATH = RESULTS_TABLE_XPATH
+    ROW_XPATH = _ROW_1417_XPATH
+    ROW_FIELDS = ("run_no", "finish")
+    ITEM_CLS = BostonItem
 
     def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        self.first_split_idx = (
-            kwargs.get("first_split_idx") if kwargs.get("first_split_idx") else 1
-        )
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath("//tr")
-        item = BostonItem()
-        for runner in runners[1:]:  # skipping table header.
-            item["run_no"] = runner.xpath("td[5]/text()").get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath("td[7]/text()").get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath("td[4]/a/@href").get()
-            )[0]
-            yield item
+        super().__init__(urls, splits)
+        self.first_split_idx: int = kwargs.get("first_split_idx", 1)
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
-        split_item = BostonSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-        split_item["race_state"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[1]/td/text()'
-        ).get()
-        split_item["last_split"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[2]/td/text()'
-        ).get()
-
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        root = response.selector.root
+        splits = SPLITS_TABLE_XPATH(root)
         keys = BostonSplitItem.get_split_keys()
-
-        for i, split in enumerate(
-            splits[self.first_split_idx :]
-        ):  # 10 rows in each splits table.
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath("td[2]/text()").get()  # time hh:mm:ss
-                pace = split.xpath("td[4]/text()").get()  # min/mile
-                speed = split.xpath("td[5]/text()").get()  # miles/h
+        # The splits are collected first so the item is built in a single call.
+        split_values = {}
+
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, self.first_split_idx, None)):
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/mile, speed miles/h
+                time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
+            split_values[key] = [time, pace, speed]
 
         # Getting runner age group.
-        age_group = response.xpath(
-            '//div[@class="detail-box box-general"]//tr[3]/td/text()'
-        ).get()
+        age_group = xpath_first(_AGE_GROUP_XPATH, root)
+        age_cat = age_group
         if age_group:
             # extracting age category from the age group. (e.g Female 18-39 -> 18-39) (e.g Female 80+ -> 80+)
-            age_cat = re.search("(\d{2}-\d{2})|(\d{2}.+?)", age_group)
-            if age_cat:
-                split_item["age_cat"] = age_cat.group()
-            else:
-                split_item["age_cat"] = age_group
-
-        yield split_item
+            if age_match := _AGE_RE.search(age_group):
+                age_cat = age_match.group()
+        race_state, last_split = xpath_row(RACE_STATE_XPATH, root)
+
+        yield BostonSplitItem(
+            idp=get_idp(response.url),
+            race_state=race_state,
+            last_split=last_split,
+            age_cat=age_cat,
+            **split_values,
+        )
 
 
-class Boston1823(scrapy.Spider):
+class Boston1823(MarathonSpider):
     """
     ### Scrapy spider used to scrap Boston marathon data between 2018 - 2023
     """
 
     name = "boston18_23"
+    RUNNERS_XPATH = RESULTS_LIST_XPATH
+    ROW_XPATH = _ROW_1823_XPATH
+    ROW_FIELDS = ("run_no", "finish")
+    ITEM_CLS = BostonItem
 
     def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        self.first_split_idx = (
-            kwargs.get("first_split_idx") if kwargs.get("first_split_idx") else 1
-        )
-        self.splits_names = {
-            "5K",
-            "10K",
-            "15K",
-            "20K",
-            "HALF",
-            "25K",
-            "30K",
-            "35K",
-            "40K",
-            "Finish Net",
-        }
+        super().__init__(urls, splits)
+        self.first_split_idx: int = kwargs.get("first_split_idx", 1)
         self.run_div_idx = 3
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
 
     def start_requests(self):
         urls = self.urls
@@ -134,73 +128,57 @@ class Boston1823(scrapy.Spider):
                 yield scrapy.Request(url=url, callback=self.parse_split)
         else:
             # This is needed since the run_no between 2018 - 2019 is div[3]; from 2021 onward it is div[2]
-            year = int(re.search("(?<=/)\d{4}(?=/)", urls[0]).group())
+            year = int(_YEAR_RE.search(urls[0]).group())
             if year > 2019:
                 self.run_div_idx = 2
             for url in urls:
                 yield scrapy.Request(url=url, callback=self.parse)
 
-    def parse(self, response):
+    def row_xpath_variables(self) -> dict[str, int]:
         """
-        ### Parse the main result pages.
+        ### Index of the run_no div, it depends on the year (see `start_requests`).
         """
-        runners = response.xpath('//li[contains(@class, " list-group-item row")]')
-        item = BostonItem()
-        for runner in runners:
-            item["run_no"] = runner.xpath(
-                f'.//div[@class="pull-left"]/div/div[{self.run_div_idx}]/text()'
-            ).get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath(
-                './/div[@class="pull-right"]/div/div[2]/text()'
-            ).get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath(".//h4/a/@href").get()
-            )[0]
-            yield item
+        return {"idx": self.run_div_idx}
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
-        split_item = BostonSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-        split_item["race_state"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[1]/td/text()'
-        ).get()
-        split_item["last_split"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[2]/td/text()'
-        ).get()
-
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        root = response.selector.root
+        splits = SPLITS_TABLE_XPATH(root)
         keys = BostonSplitItem.get_split_keys()
-
-        # This is used to keep count of how many splits need be skipped since boston marathon provide extra splits in miles.
-        extra_splits = 0
-        for i, split in enumerate(splits[self.first_split_idx :]):
-            if split.xpath("th/text()").get().strip() in self.splits_names:
-                if "estimated" not in split.xpath("@class").get():
-                    time = split.xpath("td[2]/text()").get()  # time hh:mm:ss
-                    pace = split.xpath("td[4]/text()").get()  # min/mile
-                    speed = split.xpath("td[5]/text()").get()  # miles/h
-                else:
-                    time = "-"
-                    pace = "-"
-                    speed = "-"
+        # The splits are collected first so the item is built in a single call.
+        split_values = {}
+
+        # Boston marathon provides extra splits in miles, they are skipped so each split matches its key.
+        named_splits = (
+            split
+            for split in islice(splits, self.first_split_idx, None)
+            if xpath_first(_SPLIT_NAME_XPATH, split).strip() in SPLITS_NAMES
+        )
+        for key, split in zip(keys, named_splits):
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/mile, speed miles/h
+                time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
             else:
-                extra_splits += 1
-            split_item[keys[i - extra_splits]] = [time, pace, speed]
+                time = "-"
+                pace = "-"
+                speed = "-"
+            split_values[key] = [time, pace, speed]
 
         # Getting runner age group.
-        age_group = response.xpath(
-            '//div[@class="detail-box box-general"]//tr[3]/td/text()'
-        ).get()
+        age_group = xpath_first(_AGE_GROUP_XPATH, root)
+        age_cat = age_group
         if age_group:
             # extracting age category from the age group. (e.g Female 18-39 -> 18-39) (e.g Female 80+ -> 80+)
-            age_cat = re.search("(\d{2}-\d{2})|(\d{2}.+?)", age_group)
-            if age_cat:
-                split_item["age_cat"] = age_cat.group()
-            else:
-                split_item["age_cat"] = age_group
-
-        yield split_item
+            if age_match := _AGE_RE.search(age_group):
+                age_cat = age_match.group()
+        race_state, last_split = xpath_row(RACE_STATE_XPATH, root)
+
+        yield BostonSplitItem(
+            idp=get_idp(response.url),
+            race_state=race_state,
+            last_split=last_split,
+            age_cat=age_cat,
+            **split_values,
+        )
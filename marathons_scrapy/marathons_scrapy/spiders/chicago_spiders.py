@@ -1,31 +1,51 @@
 import scrapy
 from ..items import ChicagoItem, ChicagoSplitItem
-import logging
+from .base_spider import MarathonSpider
+from ..parsing import (
+    compile_row_xpath,
+    xpath_row,
+    get_idp,
+    RESULTS_LIST_XPATH,
+    SPLITS_TABLE_XPATH,
+    RACE_STATE_XPATH,
+    is_estimated,
+)
+from itertools import islice
 import re
 
+# Patterns are compiled once at import time.
+_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2}")
+# XPath of the runners' fields (run_no, age_cat, finish, href) in the results list.
+_ROW_XPATH = compile_row_xpath(
+    './/div[@class="pull-left"]/div/div[1]/text()',
+    './/div[@class="pull-left"]/div/div[2]/text()',
+    './/div[@class="pull-right"]/div/div[$idx]/text()',
+    ".//h4/a/@href",
+)
+# XPath of the (time, pace, speed) cells of the splits table.
+_SPLIT_XPATH = compile_row_xpath(
+    'td[@class="time"]/text()',
+    'td[contains(@class, "min_km")]/text()',
+    'td[contains(@class, "kmh")]/text()',
+)
 
-class Chicago1422(scrapy.Spider):
+
+class Chicago1422(MarathonSpider):
     """
     ### Scrapy spider used to scrap Chicago marathon data between 2014 - 2022
     """
 
     name = "chicago14_23"
+    RUNNERS_XPATH = RESULTS_LIST_XPATH
+    ROW_XPATH = _ROW_XPATH
+    ROW_FIELDS = ("run_no", "age_cat", "finish")
+    ITEM_CLS = ChicagoItem
 
     def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        self.first_split_idx = (
-            kwargs.get("first_split_idx") if kwargs.get("first_split_idx") else 1
-        )
+        super().__init__(urls, splits)
+        self.first_split_idx: int = kwargs.get("first_split_idx", 1)
         self.year = kwargs.get("year")
         self.finish_div_idx = 1
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
 
     def start_requests(self):
         urls = self.urls
@@ -41,60 +61,42 @@ class Chicago1422(scrapy.Spider):
             for url in urls:
                 yield scrapy.Request(url=url, callback=self.parse)
 
-    def parse(self, response):
+    def row_xpath_variables(self) -> dict[str, int]:
         """
-        ### Parse the main result pages.
+        ### Index of the finish time div, it depends on the year (see `start_requests`).
         """
-        runners = response.xpath('//li[contains(@class, " list-group-item row")]')
-        item = ChicagoItem()
-        for runner in runners:
-            item["run_no"] = runner.xpath(
-                './/div[@class="pull-left"]/div/div[1]/text()'
-            ).get()
-            item["age_cat"] = runner.xpath(
-                './/div[@class="pull-left"]/div/div[2]/text()'
-            ).get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath(
-                f'.//div[@class="pull-right"]/div/div[{self.finish_div_idx}]/text()'
-            ).get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath(".//h4/a/@href").get()
-            )[0]
-            yield item
+        return {"idx": self.finish_div_idx}
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
+        root = response.selector.root
         split_item = ChicagoSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        split_item.idp = get_idp(response.url)
+        splits = SPLITS_TABLE_XPATH(root)
         keys = ChicagoSplitItem.get_split_keys()
 
-        for i, split in enumerate(splits[self.first_split_idx :]):
+        for key, split in zip(keys, islice(splits, self.first_split_idx, None)):
             # check if the time is not estimated.
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath('td[@class="time"]/text()').get()  # time hh:mm:ss
-                pace = split.xpath(
-                    'td[contains(@class, "min_km")]/text()'
-                ).get()  # min/km
-                speed = split.xpath('td[contains(@class, "kmh")]/text()').get()  # km/h
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/km, speed km/h
+                time, pace, speed = xpath_row(_SPLIT_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
+            setattr(split_item, key, [time, pace, speed])
 
         if (
             # Check if runners have finish split (including empty one).
-            split_item.get("k_finish")
+            split_item.k_finish
             # Check if time is available (some runners might have finish speed or pace but no time).
-            and split_item["k_finish"][0]
-            and re.match("(\d{2}:\d{2}:\d{2})", split_item["k_finish"][0])
+            and split_item.k_finish[0]
+            and _TIME_RE.match(split_item.k_finish[0])
         ):
-            split_item["race_state"] = "Finished"
-            split_item["last_split"] = "Finish"
+            split_item.race_state = "Finished"
+            split_item.last_split = "Finish"
 
         yield split_item
 
@@ -102,29 +104,22 @@ class Chicago1422(scrapy.Spider):
         """
         ### Parse the split result pages for 2022.
         """
+        root = response.selector.root
         split_item = ChicagoSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-        split_item["race_state"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[1]/td/text()'
-        ).get()
-        split_item["last_split"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[2]/td/text()'
-        ).get()
+        split_item.idp = get_idp(response.url)
+        split_item.race_state, split_item.last_split = xpath_row(RACE_STATE_XPATH, root)
 
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        splits = SPLITS_TABLE_XPATH(root)
         keys = ChicagoSplitItem.get_split_keys()
 
-        for i, split in enumerate(splits[self.first_split_idx :]):
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath('td[@class="time"]/text()').get()  # time hh:mm:ss
-                pace = split.xpath(
-                    'td[contains(@class, "min_km")]/text()'
-                ).get()  # min/km
-                speed = split.xpath('td[contains(@class, "kmh")]/text()').get()  # km/h
+        for key, split in zip(keys, islice(splits, self.first_split_idx, None)):
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/km, speed km/h
+                time, pace, speed = xpath_row(_SPLIT_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
+            setattr(split_item, key, [time, pace, speed])
 
         yield split_item
@@ -1,142 +1,98 @@
-import scrapy
 from ..items import HamburgItem, HamburgSplitItem
-import logging
-import re
-
-
-class Hamburg1317(scrapy.Spider):
+from .base_spider import MarathonSpider
+from ..parsing import (
+    compile_row_xpath,
+    xpath_row,
+    SPLIT_ROW_XPATH,
+    RESULTS_LIST_XPATH,
+    SPLITS_TABLE_XPATH,
+    RESULTS_TABLE_XPATH,
+    get_idp,
+    is_estimated,
+)
+from itertools import islice
+
+# XPath of the runners' fields (run_no, age_cat, finish, href) in the results table (2013 - 2017).
+_ROW_1317_XPATH = compile_row_xpath(
+    "td[3]/text()", "td[6]/text()", "td[8]/text()", "td[4]/a/@href"
+)
+# XPath of the (time, pace, speed) cells of the splits table (2013 - 2017).
+_SPLIT_1317_XPATH = compile_row_xpath("td[1]/text()", "td[3]/text()", "td[4]/text()")
+# XPath of the runners' fields (run_no, age_cat, finish, href) in the results list (2018 - 2023).
+_ROW_1823_XPATH = compile_row_xpath(
+    './/div[@class= " list-field type-field"]/text()',
+    './/div[@class= " list-field type-age_class"]/text()',
+    './/div[@class=" list-field type-time"]/text()',
+    ".//h4/a/@href",
+)
+
+
+class Hamburg1317(MarathonSpider):
     """
     ### Scrapy spider used to scrap Hamburg marathon data between 2013 - 2017
     """
 
     name = "hamburg13_17"
-
-    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        super().__init__()
-
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath("//tr")
-        item = HamburgItem()
-        for runner in runners[1:]:  # skipping table header.
-            item["run_no"] = runner.xpath("td[3]/text()").get()
-            item["age_cat"] = runner.xpath("td[6]/text()").get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath("td[8]/text()").get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath("td[4]/a/@href").get()
-            )[0]
-            yield item
+    RUNNERS_XPATH = RESULTS_TABLE_XPATH
+    ROW_XPATH = _ROW_1317_XPATH
+    ROW_FIELDS = ("run_no", "age_cat", "finish")
+    ITEM_CLS = HamburgItem
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
+        root = response.selector.root
         split_item = HamburgSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
+        split_item.idp = get_idp(response.url)
 
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        splits = SPLITS_TABLE_XPATH(root)
         keys = HamburgSplitItem.get_split_keys()
         # Extracting splits data.
-        for i, split in enumerate(splits[1:]):  # 10 rows in each splits table.
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, 1, None)):
             # check if the time is not estimated.
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath("td[1]/text()").get()  # time hh:mm:ss
-                pace = split.xpath("td[3]/text()").get()  # min/km
-                speed = split.xpath("td[4]/text()").get()  # km/h
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/km, speed km/h
+                time, pace, speed = xpath_row(_SPLIT_1317_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
+            setattr(split_item, key, [time, pace, speed])
         yield split_item
 
 
-class Hamburg1823(scrapy.Spider):
+class Hamburg1823(MarathonSpider):
     """
     ### Scrapy spider used to scrap Hamburg marathon data between 2018 - 2023
     """
 
     name = "hamburg18_23"
-
-    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath('//li[contains(@class, " list-group-item row")]')
-        item = HamburgItem()
-        for runner in runners:
-            item["run_no"] = runner.xpath(
-                './/div[@class= " list-field type-field"]/text()'
-            ).get()
-            item["age_cat"] = runner.xpath(
-                './/div[@class= " list-field type-age_class"]/text()'
-            ).get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath(
-                './/div[@class=" list-field type-time"]/text()'
-            ).get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath(".//h4/a/@href").get()
-            )[0]
-            yield item
+    RUNNERS_XPATH = RESULTS_LIST_XPATH
+    ROW_XPATH = _ROW_1823_XPATH
+    ROW_FIELDS = ("run_no", "age_cat", "finish")
+    ITEM_CLS = HamburgItem
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
+        root = response.selector.root
         split_item = HamburgSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
+        split_item.idp = get_idp(response.url)
 
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        splits = SPLITS_TABLE_XPATH(root)
         keys = HamburgSplitItem.get_split_keys()
-        for i, split in enumerate(splits[1:]):  # 10 rows in each splits table.
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, 1, None)):
             # check if the time is not estimated.
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath("td[2]/text()").get()  # time hh:mm:ss
-                pace = split.xpath("td[4]/text()").get()  # min/km
-                speed = split.xpath("td[5]/text()").get()  # km/h
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/km, speed km/h
+                time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
+            setattr(split_item, key, [time, pace, speed])
         yield split_item
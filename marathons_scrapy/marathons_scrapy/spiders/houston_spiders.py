@@ -1,103 +1,89 @@
-import scrapy
 from ..items import HoustonItem, HoustonSplitItem
-import logging
+from .base_spider import MarathonSpider
+from ..parsing import (
+    compile_xpath,
+    xpath_first,
+    compile_row_xpath,
+    xpath_row,
+    SPLIT_ROW_XPATH,
+    RESULTS_LIST_XPATH,
+    SPLITS_TABLE_XPATH,
+    get_idp,
+    is_estimated,
+)
+from itertools import islice
 import re
 
+# Patterns are compiled once at import time.
+_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2}")
+# Race state of the runners that did not finish, by the (lower case) status shown in the Totals table.
+_RACE_STATES: dict[str, str] = {
+    "dnf": "DNF",
+    "dq - over 6h": "DQ - Over 6h",
+    "dq - over 6hs": "DQ - Over 6h",
+    "dq over 6 hours": "DQ - Over 6h",
+    "dq - over 6 hrs": "DQ - Over 6h",
+    "over 6h": "DQ - Over 6h",
+    "dq - switch from half to mara": "DQ - SWITCH from HALF to MARA",
+    "dq - missing split": "DQ - missing split",
+    "missing splits": "DQ - missing split",
+    "dq": "DQ - No Reason Was Given",
+    "dq -": "DQ - No Reason Was Given",
+    "dns": "DNS -  Did Not Start",
+}
+# XPath of the "Finish Net" cell (4th row) of the Totals table in the split result pages.
+_FINISH_NET_XPATH = compile_xpath(
+    '(//div[@class="detail-box box-totals"]//tr)[4]/td[1]/text()'
+)
+# XPath of the runners' fields (run_no, age_cat, finish, href) in the results list.
+_ROW_XPATH = compile_row_xpath(
+    './/div[@class= " list-field type-field"]/text()',
+    './/div[@class= " list-field type-age_class"]/text()',
+    './/div[@class="split list-field type-time"]/text()',
+    ".//h4/a/@href",
+)
 
-class Houston1819(scrapy.Spider):
+
+class Houston1819(MarathonSpider):
     """
     ### Scrapy spider used to scrap Houston marathon data between 2018 - 2019
     """
 
     name = "houston18_19"
-
-    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath('//li[contains(@class, " list-group-item row")]')
-        item = HoustonItem()
-        for runner in runners:
-            item["run_no"] = runner.xpath(
-                './/div[@class= " list-field type-field"]/text()'
-            ).get()
-            item["age_cat"] = runner.xpath(
-                './/div[@class= " list-field type-age_class"]/text()'
-            ).get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath(
-                './/div[@class="split list-field type-time"]/text()'
-            ).get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath(".//h4/a/@href").get()
-            )[0]
-            yield item
+    RUNNERS_XPATH = RESULTS_LIST_XPATH
+    ROW_XPATH = _ROW_XPATH
+    ROW_FIELDS = ("run_no", "age_cat", "finish")
+    ITEM_CLS = HoustonItem
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
+        root = response.selector.root
         split_item = HoustonSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
+        split_item.idp = get_idp(response.url)
 
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        splits = SPLITS_TABLE_XPATH(root)
         keys = HoustonSplitItem.get_split_keys()
-        for i, split in enumerate(splits[1:]):  # 10 rows in each splits table.
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, 1, None)):
             # check if the time is not estimated.
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath("td[2]/text()").get()  # time hh:mm:ss
-                pace = split.xpath("td[4]/text()").get()  # min/mile
-                speed = split.xpath("td[5]/text()").get()  # miles/h
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/mile, speed miles/h
+                time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
-
-        # Totals table in runner split page.
-        total = response.xpath('//div[@class="detail-box box-totals"]//tr')[3]
+            setattr(split_item, key, [time, pace, speed])
 
         # This not actual finish_status since "Finish Net" is the field being scraped (a row in Totals table),
         # this row includes the finish time for runners that did finish, for other runners it displayed DNF (Did Not FInish) or DSQ (Disqualified).
-        finish_status = total.xpath("td[1]/text()").get()
+        finish_status = xpath_first(_FINISH_NET_XPATH, root)
 
-        if re.match("(\d{2}:\d{2}:\d{2})", finish_status):
-            split_item["race_state"] = "Finished"
+        if _TIME_RE.match(finish_status):
+            split_item.race_state = "Finished"
         else:
-            match finish_status.lower():  # Python 3.10.x+
-                case "dnf":
-                    split_item["race_state"] = "DNF"
-                case "dq - over 6h" | "dq - over 6hs" | "dq over 6 hours" | "dq - over 6 hrs" | "over 6h":
-                    split_item["race_state"] = "DQ - Over 6h"
-                case "dq - switch from half to mara":
-                    split_item["race_state"] = "DQ - SWITCH from HALF to MARA"
-                case "dq - missing split" | "missing splits":
-                    split_item["race_state"] = "DQ - missing split"
-                case "dq" | "dq -":
-                    split_item["race_state"] = "DQ - No Reason Was Given"
-                case "dns":
-                    split_item["race_state"] = "DNS -  Did Not Start"
-                case _:
-                    split_item["race_state"] = "Other"
+            split_item.race_state = _RACE_STATES.get(finish_status.lower(), "Other")
 
         yield split_item
@@ -1,146 +1,86 @@
-import scrapy
 from ..items import LondonItem, LondonSplitItem
-import logging
-import re
-
-
-class LondonSpider1418(scrapy.Spider):
+from .base_spider import MarathonSpider
+from ..parsing import (
+    compile_row_xpath,
+    xpath_row,
+    SPLIT_ROW_XPATH,
+    RESULTS_LIST_XPATH,
+    SPLITS_TABLE_XPATH,
+    RACE_STATE_XPATH,
+    RESULTS_TABLE_XPATH,
+    get_idp,
+)
+from itertools import islice
+
+# XPath of the runners' fields (run_no, age_cat, half, finish, href) in the results table (2014 - 2018).
+_ROW_1418_XPATH = compile_row_xpath(
+    "td[6]/text()", "td[7]/text()", "td[8]/text()", "td[9]/text()", "td[4]/a/@href"
+)
+# XPath of the runners' fields (run_no, age_cat, half, finish, href) in the results list (2019 - 2023).
+_ROW_1923_XPATH = compile_row_xpath(
+    './/div[@class= " list-field type-field"]/text()',
+    './/div[@class= " list-field type-age_class"]/text()',
+    './/div[@class="split list-field type-time hidden-xs"]/text()',
+    './/div[@class="split list-field type-time"]/text()',
+    ".//h4/a/@href",
+)
+
+
+class LondonSpider1418(MarathonSpider):
     """
     ### Scrapy spider used to scrap London marathon data between 2014 - 2018
     """
 
     name = "london14_18"
-
-    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath("//tr")
-        item = LondonItem()
-        for runner in runners[1:]:  # skipping table header.
-            item["run_no"] = runner.xpath("td[6]/text()").get()
-            item["age_cat"] = runner.xpath("td[7]/text()").get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["half"] = runner.xpath("td[8]/text()").get()
-            item["finish"] = runner.xpath("td[9]/text()").get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath("td[4]/a/@href").get()
-            )[0]
-            yield item
+    RUNNERS_XPATH = RESULTS_TABLE_XPATH
+    ROW_XPATH = _ROW_1418_XPATH
+    ROW_FIELDS = ("run_no", "age_cat", "half", "finish")
+    ITEM_CLS = LondonItem
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
+        root = response.selector.root
         split_item = LondonSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-        split_item["race_state"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[1]/td/text()'
-        ).get()
-        split_item["last_split"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[2]/td/text()'
-        ).get()
+        split_item.idp = get_idp(response.url)
+        split_item.race_state, split_item.last_split = xpath_row(RACE_STATE_XPATH, root)
 
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        splits = SPLITS_TABLE_XPATH(root)
         keys = LondonSplitItem.get_split_keys()
-        for i, split in enumerate(splits[1:]):  # 10 rows in each splits table.
-            time = split.xpath("td[2]/text()").get()  # time
-            pace = split.xpath("td[4]/text()").get()  # min/km
-            speed = split.xpath("td[5]/text()").get()  # km/h
-            split_item[keys[i]] = [time, pace, speed]
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, 1, None)):
+            # time, pace min/km, speed km/h
+            time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
+            setattr(split_item, key, [time, pace, speed])
         yield split_item
 
 
-class LondonSpider1923(scrapy.Spider):
+class LondonSpider1923(MarathonSpider):
     """
     ### Scrapy spider used to scrap London marathon data between 2019 - 2023
     """
 
     name = "london19_23"
-
-    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath('//li[contains(@class, " list-group-item row")]')
-        item = LondonItem()
-        for runner in runners:
-            item["run_no"] = runner.xpath(
-                './/div[@class= " list-field type-field"]/text()'
-            ).get()
-            item["age_cat"] = runner.xpath(
-                './/div[@class= " list-field type-age_class"]/text()'
-            ).get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["half"] = runner.xpath(
-                './/div[@class="split list-field type-time hidden-xs"]/text()'
-            ).get()
-            item["finish"] = runner.xpath(
-                './/div[@class="split list-field type-time"]/text()'
-            ).get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath(".//h4/a/@href").get()
-            )[0]
-            yield item
+    RUNNERS_XPATH = RESULTS_LIST_XPATH
+    ROW_XPATH = _ROW_1923_XPATH
+    ROW_FIELDS = ("run_no", "age_cat", "half", "finish")
+    ITEM_CLS = LondonItem
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
+        root = response.selector.root
         split_item = LondonSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-        split_item["race_state"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[1]/td/text()'
-        ).get()
-        split_item["last_split"] = response.xpath(
-            '//div[@class="detail-box box-state"]//tr[2]/td/text()'
-        ).get()
+        split_item.idp = get_idp(response.url)
+        split_item.race_state, split_item.last_split = xpath_row(RACE_STATE_XPATH, root)
 
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        splits = SPLITS_TABLE_XPATH(root)
         keys = LondonSplitItem.get_split_keys()
-        for i, split in enumerate(splits[1:]):  # 10 rows in each splits table.
-            time = split.xpath("td[2]/text()").get()  # time
-            pace = split.xpath("td[4]/text()").get()  # min/km
-            speed = split.xpath("td[5]/text()").get()  # km/h
-            split_item[keys[i]] = [time, pace, speed]
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, 1, None)):
+            # time, pace min/km, speed km/h
+            time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
+            setattr(split_item, key, [time, pace, speed])
         yield split_item
@@ -1,88 +1,81 @@
-import scrapy
 from ..items import StockholmItem, StockholmSplitItem
-import logging
+from .base_spider import MarathonSpider
+from ..parsing import (
+    compile_xpath,
+    compile_row_xpath,
+    xpath_first,
+    xpath_row,
+    SPLIT_ROW_XPATH,
+    RESULTS_LIST_XPATH,
+    SPLITS_TABLE_XPATH,
+    get_idp,
+    is_estimated,
+)
+from itertools import islice
 import re
 
+# Patterns are compiled once at import time.
+_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2}")
+# XPath of the runners' fields (run_no, finish, href) in the results list.
+_ROW_XPATH = compile_row_xpath(
+    './/div[@class= " list-field type-field"]/text()',
+    './/div[@class="right list-field type-time"]/text()',
+    ".//h4/a/@href",
+)
+# XPath of the runner's year of birth (6th row of the general box) in the split result pages.
+_YOB_XPATH = compile_xpath(
+    '(//div[@class="detail-box box-general"]//tr)[6]/td[1]/text()'
+)
 
-class Stockholm2122(scrapy.Spider):
+
+class Stockholm2122(MarathonSpider):
     """
     ### Scrapy spider used to scrap Stockholm marathon data between 2021 - 2022.
     """
 
     name = "stockholm21_22"
-
-    def __init__(self, urls: list[str], splits: bool = False, **kwargs):
-        self.urls: str = urls
-        self.splits: bool = splits
-        super().__init__()
-
-    # Logging info
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=logging.INFO,
-    )
-
-    def start_requests(self):
-        urls = self.urls
-        if self.splits:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse_split)
-        else:
-            for url in urls:
-                yield scrapy.Request(url=url, callback=self.parse)
-
-    def parse(self, response):
-        """
-        ### Parse the main result pages.
-        """
-        runners = response.xpath('//li[contains(@class, " list-group-item row")]')
-        item = StockholmItem()
-        for runner in runners:
-            item["run_no"] = runner.xpath(
-                './/div[@class= " list-field type-field"]/text()'
-            ).get()
-            item["gender"] = re.findall(".(?=&num)", response.url)[0]
-            item["finish"] = runner.xpath(
-                './/div[@class="right list-field type-time"]/text()'
-            ).get()
-            item["idp"] = re.findall(
-                "(?<=idp=).+?(?=&)", runner.xpath(".//h4/a/@href").get()
-            )[0]
-            yield item
+    RUNNERS_XPATH = RESULTS_LIST_XPATH
+    ROW_XPATH = _ROW_XPATH
+    ROW_FIELDS = ("run_no", "finish")
+    ITEM_CLS = StockholmItem
 
     def parse_split(self, response):
         """
         ### Parse the split result pages.
         """
-        # Scraping Splits.
-        split_item = StockholmSplitItem()
-        split_item["idp"] = re.findall("(?<=idp=).+?(?=&)", response.url)[0]
-
-        splits = response.xpath('//div[@class="detail-box box-splits"]//tr')
+        root = response.selector.root
+        splits = SPLITS_TABLE_XPATH(root)
         keys = StockholmSplitItem.get_split_keys()
-        for i, split in enumerate(splits[1:]):  # 10 rows in each splits table.
+        # The splits are collected first so the item is built in a single call.
+        split_values = {}
+
+        # 10 rows in each splits table.
+        for key, split in zip(keys, islice(splits, 1, None)):
             # check if the time is not estimated.
-            if "estimated" not in split.xpath("@class").get():
-                time = split.xpath("td[2]/text()").get()  # time hh:mm:ss
-                pace = split.xpath("td[4]/text()").get()  # min/km
-                speed = split.xpath("td[5]/text()").get()  # km/h
+            if not is_estimated(split):
+                # time hh:mm:ss, pace min/km, speed km/h
+                time, pace, speed = xpath_row(SPLIT_ROW_XPATH, split)
             else:
                 time = "-"
                 pace = "-"
                 speed = "-"
-            split_item[keys[i]] = [time, pace, speed]
+            split_values[key] = [time, pace, speed]
 
+        race_state = None
+        finish = split_values.get("k_finish")
         if (
             # Check if runners have finish split (including empty one).
-            split_item.get("k_finish")
+            finish
             # Check if time is available (some runners might have finish speed or pace but no time).
-            and split_item["k_finish"][0]
-            and re.match("(\d{2}:\d{2}:\d{2})", split_item["k_finish"][0])
+            and finish[0]
+            and _TIME_RE.match(finish[0])
         ):
-            split_item["race_state"] = "Finished"
-
-        # Scraping YOB: year of birth.
-        yob_row = response.xpath('//div[@class="detail-box box-general"]//tr')[5]
-        split_item["yob"] = yob_row.xpath("td[1]/text()").get()
+            race_state = "Finished"
 
-        yield split_item
+        yield StockholmSplitItem(
+            idp=get_idp(response.url),
+            race_state=race_state,
+            # YOB: year of birth.
+            yob=xpath_first(_YOB_XPATH, root),
+            **split_values,
+        )
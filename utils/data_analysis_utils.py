@@ -1,9 +1,28 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy.stats import gaussian_kde
 from sklearn.metrics import precision_recall_curve
 
 
+def get_split_cols(df: pd.DataFrame, split_data: str) -> list[str]:
+    """
+    ### Get the names of the split columns of `split_data` (e.g. `k_5_time`, ..., `k_finish_time`).
+    ----
+    ### Arguments:
+    + df: The DataFrame with the split columns.
+    + split_data: The split data (either `time`, `pace`, or `speed`).
+    ----
+    ### Returns:
+    + The columns' names, in the same order as in the DataFrame.
+    """
+    cols = df.columns
+    return cols[
+        cols.str.startswith("k_") & cols.str.endswith(f"_{split_data}")
+    ].tolist()
+
+
 def plot_feature_skewness(
     df: pd.DataFrame, split_data: str = "time", fig_size: tuple[int, int] = (10, 5)
 ) -> None:
@@ -19,7 +38,7 @@ def plot_feature_skewness(
     + None
     """
     plt.figure(figsize=fig_size)
-    df.filter(regex=f"^k_.*_{split_data}$").skew().plot(
+    df[get_split_cols(df, split_data)].skew().plot(
         kind="bar",
         color="teal",
         rot=45,
@@ -46,33 +65,27 @@ def plot_runners_dist(df: pd.DataFrame, fig_size: tuple[int, int] = (12, 10)) ->
     """
     plt.figure(figsize=fig_size)
 
+    # The bars are drawn from the counts directly, computed once per column.
     # Distribution of runners based on runner_type
     plt.subplot(2, 2, 1)
-    sns.countplot(
-        data=df,
-        x="runner_type",
-        order=df["runner_type"].value_counts().index,
-        palette="viridis",
-    )
+    counts = df["runner_type"].value_counts()
+    sns.barplot(x=counts.index, y=counts.values, palette="viridis")
     plt.title("Distribution of Runners by Type")
     plt.xticks(rotation=45)
     plt.ylabel("Number of Runners")
 
     # Distribution of runners based on age category
     plt.subplot(2, 2, 2)
-    sns.countplot(
-        data=df,
-        x="age_cat",
-        order=df["age_cat"].value_counts().index,
-        palette="viridis",
-    )
+    counts = df["age_cat"].value_counts()
+    sns.barplot(x=counts.index, y=counts.values, palette="viridis")
     plt.title("Distribution of Runners by Age Category")
     plt.xticks(rotation=45)
     plt.ylabel("Number of Runners")
 
     # Distribution of runners based on gender
     plt.subplot(2, 2, 3)
-    sns.countplot(data=df, x="gender", palette="cool")
+    counts = df["gender"].value_counts(sort=False)
+    sns.barplot(x=counts.index, y=counts.values, palette="cool")
     plt.title("Distribution of Runners by Gender")
     plt.ylabel("Number of Runners")
 
@@ -102,13 +115,17 @@ def plot_splits_feature_dist(
     unit_dict = {"time": "seconds", "pace": "sec/km", "speed": "km/h"}
     plt.figure(figsize=(15, 10))
     # Selecting the columns related to the split data
-    subset = df.filter(regex=f"k_.*_{split_data}")
-    # Getting the columns names.
-    features_to_check = subset.columns.to_list()
+    features_to_check = get_split_cols(df, split_data)
     # Plotting the distribution of each split
     for i, feature in enumerate(features_to_check, 1):
         plt.subplot(5, 2, i)
-        sns.histplot(data=subset, x=feature, bins=50, kde=True)
+        values = df[feature].dropna().to_numpy(dtype=np.float64)
+        _, bin_edges, _ = plt.hist(values, bins=50, alpha=0.6, edgecolor="white")
+        # Density curve scaled to the number of runners per bin (like seaborn's histplot kde).
+        if values.size > 1 and values.min() < values.max():
+            xs = np.linspace(bin_edges[0], bin_edges[-1], 200)
+            bin_width = bin_edges[1] - bin_edges[0]
+            plt.plot(xs, gaussian_kde(values)(xs) * values.size * bin_width)
         plt.title(f"Distribution of {feature}")
         plt.xlabel(f"{feature.capitalize()} (in {unit_dict[split_data]})")
         plt.ylabel("Number of Runners")
@@ -137,9 +154,9 @@ def plot_split_data_trend(
         "speed",
     ], "split_data must be either `time`, `pace`, or `speed`."
     unit_dict = {"time": "seconds", "pace": "sec/km", "speed": "km/h"}
-    cols = [col for col in df.columns if f"_{split_data}" in col]
+    cols = get_split_cols(df, split_data)
     # Calculating the average split times.
-    avg_split_data = df.filter(regex=f"k_.*_{split_data}").mean()
+    avg_split_data = df[cols].mean()
     # Calculating non-cumulative split times.
     if split_data == "time":
         non_cumulative_times = avg_split_data.diff()
@@ -186,95 +203,42 @@ def plot_split_data_trend_by_cat(
     ], "split_data must be either `time`, `pace`, or `speed`."
 
     unit_dict = {"time": "seconds", "pace": "sec/km", "speed": "km/h"}
-    cols = [col for col in df.columns if f"_{split_data}" in col]
+    cols = get_split_cols(df, split_data)
+    # (category, title suffix, legend kwargs) of each subplot.
+    categories = (
+        ("gender", "Gender", {"loc": "best"}),
+        ("age_cat", "Age Category", {"loc": "best"}),
+        (
+            "runner_type",
+            "Runner Type",
+            {"loc": "lower left", "bbox_to_anchor": (0.95, 0)},
+        ),
+    )
 
     plt.figure(figsize=fig_size)
 
-    category = "gender"
-    if split_data == "time":
-        # Calculating the average split times.
+    for i, (category, cat_name, legend_kwargs) in enumerate(categories, 1):
+        # Calculating the average split data of each category type.
         grouped_cat_type = df.groupby(category)[cols].mean().transpose()
-        # Getting the first split times.
-        k_5_non_cum_time = grouped_cat_type.loc[cols[0]]
-        # Calculating non-cumulative split times.
-        grouped_cat_type = grouped_cat_type.diff()
-        # Adding the first split times to the non-cumulative split times since the first split remains the same.
-        grouped_cat_type.loc[cols[0]] = k_5_non_cum_time
-    else:
-        grouped_cat_type = df.groupby(category)[cols].mean().transpose()
-    plt.subplot(2, 2, 1)
-    for cat_type in grouped_cat_type.columns:
-        plt.plot(
-            grouped_cat_type.index,
-            grouped_cat_type[cat_type],
-            marker="o",
-            label=cat_type,
-        )
-    plt.title(f"Average {split_data} Across Race Progression by Gender")
-    plt.xlabel("Race Splits")
-    plt.ylabel(f"Average {split_data} (in {unit_dict[split_data]})")
-    plt.xticks(rotation=45)
-    plt.legend(loc="best")
-    plt.grid(True, which="both", linestyle="--", linewidth=0.5)
-    plt.tight_layout()
+        if split_data == "time":
+            # Calculating non-cumulative split times, the first split remains the same.
+            grouped_cat_type.iloc[1:] = grouped_cat_type.diff().iloc[1:]
+        plt.subplot(2, 2, i)
+        for cat_type in grouped_cat_type.columns:
+            plt.plot(
+                grouped_cat_type.index,
+                grouped_cat_type[cat_type],
+                marker="o",
+                label=cat_type,
+            )
+        plt.title(f"Average {split_data} Across Race Progression by {cat_name}")
+        plt.xlabel("Race Splits")
+        plt.ylabel(f"Average {split_data} (in {unit_dict[split_data]})")
+        plt.xticks(rotation=45)
+        plt.legend(**legend_kwargs)
+        plt.grid(True, which="both", linestyle="--", linewidth=0.5)
 
-    category = "age_cat"
-    if split_data == "time":
-        # Calculating the average split times.
-        grouped_cat_type = df.groupby(category)[cols].mean().transpose()
-        # Getting the first split times.
-        k_5_non_cum_time = grouped_cat_type.loc[cols[0]]
-        # Calculating non-cumulative split times.
-        grouped_cat_type = grouped_cat_type.diff()
-        # Adding the first split times to the non-cumulative split times since the first split remains the same.
-        grouped_cat_type.loc[cols[0]] = k_5_non_cum_time
-    else:
-        grouped_cat_type = df.groupby(category)[cols].mean().transpose()
-    plt.subplot(2, 2, 2)
-    for cat_type in grouped_cat_type.columns:
-        plt.plot(
-            grouped_cat_type.index,
-            grouped_cat_type[cat_type],
-            marker="o",
-            label=cat_type,
-        )
-
-    plt.title(f"Average {split_data} Across Race Progression by Age Category")
-    plt.xlabel("Race Splits")
-    plt.ylabel(f"Average {split_data} {unit_dict[split_data]}")
-    plt.xticks(rotation=45)
-    plt.legend(loc="best")
-    plt.grid(True, which="both", linestyle="--", linewidth=0.5)
-    plt.tight_layout()
-
-    category = "runner_type"
-    if split_data == "time":
-        # Calculating the average split times.
-        grouped_cat_type = df.groupby(category)[cols].mean().transpose()
-        # Getting the first split times.
-        k_5_non_cum_time = grouped_cat_type.loc[cols[0]]
-        # Calculating non-cumulative split times.
-        grouped_cat_type = grouped_cat_type.diff()
-        # Adding the first split times to the non-cumulative split times since the first split remains the same.
-        grouped_cat_type.loc[cols[0]] = k_5_non_cum_time
-    else:
-        grouped_cat_type = df.groupby(category)[cols].mean().transpose()
-    plt.subplot(2, 2, 3)
-    for cat_type in grouped_cat_type.columns:
-        plt.plot(
-            grouped_cat_type.index,
-            grouped_cat_type[cat_type],
-            marker="o",
-            label=cat_type,
-        )
-    plt.title(f"Average {split_data} Across Race Progression by Runner Type")
-    plt.xlabel("Race Splits")
-    plt.ylabel(f"Average {split_data} {unit_dict[split_data]}")
-    plt.xticks(rotation=45)
-    plt.legend(loc="lower left", bbox_to_anchor=(0.95, 0))
-    plt.grid(True, which="both", linestyle="--", linewidth=0.5)
     plt.tight_layout()
-
     plt.show()
 
 
@@ -298,20 +262,15 @@ def plot_non_finishers_by_cat(
         "gender",
         "runner_type",
     ], "category must be either `age_cat`, `gender`, or `runner_type`."
-    # Select non-finishers.
-    data = df[df["race_state"] == "Started"]
+    # Count the non-finishers of each category type.
+    counts = df.loc[df["race_state"] == "Started", category].value_counts()
     plt.figure(figsize=fig_size)
-    sns.countplot(
-        data=data,
-        x=category,
-        hue="race_state",
-        palette="YlGnBu",
-        order=data[category].value_counts().index,
+    sns.barplot(
+        x=counts.index, y=counts.values, color=sns.color_palette("YlGnBu", 1)[0]
     )
     plt.title(f"Distribution of Non-Finishers by {category}")
     plt.xlabel(f"{category.capitalize()}")
     plt.ylabel("Number of Non-Finishers")
-    plt.legend().remove()
     plt.show()
 
 
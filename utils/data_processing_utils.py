@@ -44,19 +44,17 @@ def london_cleaner(
     if cols_to_drop and len(cols_to_drop) >= 1:
         df.drop(cols_to_drop, axis=1, inplace=True)
 
-    # 2. Replace the characters that match `regex_pattern` by the `replace_value`. N.B Works but Slow.
-    df = replace_value_in_cols(df, regex_pattern="('-'|'+|-| )")
+    # 2. Replace the split cells that contain `chars` by the `replace_value`.
+    df = replace_value_in_cols(df)
 
     # 3. Removing runners did not start.
     # 3.1 Runners that have a race_state == "Not Started" will be dropped.
     print("** Removing Runners That did not start:")
     rows_count = len(df)
-    df = df.drop(df.loc[df.race_state == "Not Started"].index).reset_index(drop=True)
+    not_started = df.race_state == "Not Started"
     # 3.2 Runners that do not have any split data will be dropped.
-    not_started_indices = df[
-        df.iloc[:, df.columns.str.startswith("k_")].isna().values.all(axis=1)
-    ].index
-    df = df.drop(index=not_started_indices).reset_index(drop=True)
+    not_started |= df.iloc[:, df.columns.str.startswith("k_")].isna().values.all(axis=1)
+    df = df.loc[~not_started].reset_index(drop=True)
     print(
         f"Original rows count: {rows_count} || New rows count: {len(df)} || Dropped Rows: {rows_count - len(df)}"
     )
@@ -135,7 +133,7 @@ def hamburg_cleaner(
     if cols_to_drop and len(cols_to_drop) >= 1:
         df.drop(cols_to_drop, axis=1, inplace=True)
 
-    # 2. Replace the characters match `regex_pattern` by the `replace_value`. N.B Works but Slow.
+    # 2. Replace the split cells that contain `chars` by the `replace_value`.
     df = replace_value_in_cols(df)
 
     # 3. Removing runners did not start. (if all splits columns are null then the runner did not start.)
@@ -233,7 +231,7 @@ def stockholm_cleaner(
     if cols_to_drop and len(cols_to_drop) >= 1:
         df.drop(cols_to_drop, axis=1, inplace=True)
 
-    # 2. Replace the characters match `regex_pattern` by the `replace_value`. N.B Works but Slow.
+    # 2. Replace the split cells that contain `chars` by the `replace_value`.
     df = replace_value_in_cols(df)
 
     # 3. Removing runners did not start. (if all splits columns are null then the runner did not start.)
@@ -339,19 +337,17 @@ def boston_cleaner(
     if cols_to_drop and len(cols_to_drop) >= 1:
         df.drop(cols_to_drop, axis=1, inplace=True)
 
-    # 2. Replace the characters that match `regex_pattern` by the `replace_value`. N.B Works but Slow.
-    df = replace_value_in_cols(df, regex_pattern="('-'|'+|-| )")
+    # 2. Replace the split cells that contain `chars` by the `replace_value`.
+    df = replace_value_in_cols(df)
 
     # 3. Removing runners did not start.
     # 3.1 Runners that have a race_state == "Not Started" will be dropped.
     print("** Removing Runners That did not start:")
     rows_count = len(df)
-    df = df.drop(df.loc[df.race_state == "not started"].index).reset_index(drop=True)
+    not_started = df.race_state == "not started"
     # 3.2 Runners that do not have any split data will be dropped.
-    not_started_indices = df[
-        df.iloc[:, df.columns.str.startswith("k_")].isna().values.all(axis=1)
-    ].index
-    df = df.drop(index=not_started_indices).reset_index(drop=True)
+    not_started |= df.iloc[:, df.columns.str.startswith("k_")].isna().values.all(axis=1)
+    df = df.loc[~not_started].reset_index(drop=True)
     print(
         f"Original rows count: {rows_count} || New rows count: {len(df)} || Dropped Rows: {rows_count - len(df)}"
     )
@@ -447,7 +443,7 @@ def chicago_cleaner(
     if cols_to_drop and len(cols_to_drop) >= 1:
         df.drop(cols_to_drop, axis=1, inplace=True)
 
-    # 2. Replace the characters match `regex_pattern` by the `replace_value`. N.B Works but Slow.
+    # 2. Replace the split cells that contain `chars` by the `replace_value`.
     df = replace_value_in_cols(df)
 
     # 3. Removing runners did not start. (if all splits columns are null then the runner did not start.)
@@ -568,8 +564,8 @@ def houston_cleaner(
     if cols_to_drop and len(cols_to_drop) >= 1:
         df.drop(cols_to_drop, axis=1, inplace=True)
 
-    # 2. Replace the characters that match `regex_pattern` by the `replace_value`. N.B Works but Slow.
-    df = replace_value_in_cols(df, regex_pattern="('-'|'+|-| )")
+    # 2. Replace the split cells that contain `chars` by the `replace_value`.
+    df = replace_value_in_cols(df)
 
     # 3. Removing runners did not start.
     # 3.1 Runners that have a race_state == "Not Started" will be dropped.
@@ -577,10 +573,8 @@ def houston_cleaner(
     rows_count = len(df)
     # df = df.drop(df.loc[df.race_state == "not started"].index).reset_index(drop=True)
     # 3.2 Runners that do not have any split data will be dropped.
-    not_started_indices = df[
-        df.iloc[:, df.columns.str.startswith("k_")].isna().values.all(axis=1)
-    ].index
-    df = df.drop(index=not_started_indices).reset_index(drop=True)
+    not_started = df.iloc[:, df.columns.str.startswith("k_")].isna().values.all(axis=1)
+    df = df.loc[~not_started].reset_index(drop=True)
     print(
         f"Original rows count: {rows_count} || New rows count: {len(df)} || Dropped Rows: {rows_count - len(df)}"
     )
@@ -702,22 +696,12 @@ def convert_to_sec(df: pd.DataFrame, splits_keys: list[str]) -> pd.DataFrame:
         k_time = f"{key}_time"
         k_pace = f"{key}_pace"
         # Converting time and pace of a split from hh:mm:ss to seconds.
-        df[k_time] = (
-            pd.to_timedelta(df[k_time], errors="coerce")
-            .astype("timedelta64[s]")
-            .dt.seconds
-        )
+        df[k_time] = pd.to_timedelta(df[k_time], errors="coerce").dt.total_seconds()
         # Adding "00:" prefix to the pace to change its format from mm:ss -> hh:mm:ss
         # if the pace is already in the correct format (hh:mm:ss) it is not changed
-        non_null_rows = ~df[k_pace].isnull()
-        df.loc[non_null_rows, k_pace] = df.loc[non_null_rows, k_pace].map(
-            lambda x: "00:" + x if len(x) == 5 else x
-        )
-        df[k_pace] = (
-            pd.to_timedelta(df[k_pace], errors="coerce")
-            .astype("timedelta64[s]")
-            .dt.seconds
-        )
+        pace = df[k_pace].astype("string")
+        pace = pace.mask(pace.str.len() == 5, "00:" + pace)
+        df[k_pace] = pd.to_timedelta(pace, errors="coerce").dt.total_seconds()
     return df
 
 
@@ -732,9 +716,11 @@ def convert_split_dtype(df: pd.DataFrame, splits_keys: list[str]) -> pd.DataFram
     ----
     ### Returns the DataFrame.
     """
+    # The time and pace (already in seconds) of all the splits are cast in one call.
+    int_cols = [f"{key}_{data}" for key in splits_keys for data in ("time", "pace")]
+    df[int_cols] = df[int_cols].astype("Int32")
     for key in splits_keys:
-        df[f"{key}_time"] = df[f"{key}_time"].astype("Int32")
-        df[f"{key}_pace"] = df[f"{key}_pace"].astype("Int32")
+        # downcast="float" already returns float32.
         df[f"{key}_speed"] = pd.to_numeric(
             df[f"{key}_speed"], errors="coerce", downcast="float"
         )
@@ -779,26 +765,34 @@ def drop_null_by_col(df: pd.DataFrame, cols: str) -> pd.DataFrame:
     return df
 
 
-def replace_value_in_cols(
-    df: pd.DataFrame, regex_pattern: str = "('-'|'+|-| )", replace_value=None
-):
+def replace_value_in_cols(df: pd.DataFrame, chars: str = "'- ", replace_value=None):
     """
-    ### Function to replace the characters in the `regex_pattern` by `replace_pattern`, it utilise pandas replace function with `regex=True`.
+    ### Function to replace the split cells that contain any of the characters in `chars` by `replace_value`.
     #### N.B The function only check split columns, their name start with `k_`.
     ----
     ### Arguments:
     + df: DataFrame to operate on.
-    + regex_pattern: The regex pattern to match characters to.
-        Default: `('-'|'+|-| )`; which matches `(hyphen: - or '-') or (apostrophe: ') or (space: )`.
-    + replace_value: The character to replace the matched value.
+    + chars: The characters to look for.
+        Default: `'- `; which matches `(hyphen: - or '-') or (apostrophe: ') or (space: )`.
+    + replace_value: The value replacing the matched cells.
         Default: None.
     ----
-    ### Returns the DataFrame after replacing the match characters with the new value.
-    """
-    cols = df.columns.str.startswith("k_")
-    df.loc[:, cols] = df.loc[:, cols].replace(
-        to_replace=regex_pattern, value=replace_value, regex=True
-    )
+    ### Returns the DataFrame after replacing the matched cells with the new value.
+    """
+    chars = frozenset(chars)
+    for col in df.columns[df.columns.str.startswith("k_")]:
+        values = df[col]
+        # Set lookups on the cells' characters instead of running a regex on every cell.
+        matched = np.fromiter(
+            (
+                isinstance(value, str) and not chars.isdisjoint(value)
+                for value in values.to_numpy()
+            ),
+            dtype=bool,
+            count=len(values),
+        )
+        if matched.any():
+            df[col] = values.mask(matched, replace_value)
     return df
 
 
@@ -1044,11 +1038,11 @@ def drop_finishers_with_missing_data(df: pd.DataFrame) -> pd.DataFrame:
     ### Returns:
     + df: pd.DataFrame - DataFrame with dropped rows.
     """
-    # Get indices of rows with missing data and they are finishers.
-    indices = df[(df.isna().any(axis=1)) & (df["race_state"] == "Finished")].index
-    print(f"** Dropping finishers with any missing split data: {indices.shape[0]}")
+    # Get the rows with missing data and they are finishers.
+    missing = df.isna().any(axis=1) & (df["race_state"] == "Finished")
+    print(f"** Dropping finishers with any missing split data: {missing.sum()}")
     # Drop rows with missing data.
-    df = df.drop(indices).reset_index(drop=True)
+    df = df.loc[~missing].reset_index(drop=True)
     return df
 
 
@@ -1064,11 +1058,11 @@ def drop_rows_with_splits_speed_above(
     ----
     ### Returns the DataFrame after dropping the rows.
     """
-    # Get the indices of rows with splits speed above the limit.
-    indices = df[(df.loc[:, "k_5_speed"::3] > limit).any(axis=1)].index
-    print(f"** Dropping rows with any split speed > {limit}km/h: {indices.shape[0]}")
+    # Get the rows with splits speed above the limit.
+    above = (df.loc[:, "k_5_speed"::3] > limit).any(axis=1)
+    print(f"** Dropping rows with any split speed > {limit}km/h: {above.sum()}")
     # Drop the rows.
-    df = df.drop(index=indices).reset_index(drop=True)
+    df = df.loc[~above].reset_index(drop=True)
     return df
 
 
@@ -14,6 +14,7 @@ def get_settings(
     _format: str = "csv",
     overwrite: bool = True,
     data_path: str = "Marathons_Data/",
+    concurrent_requests: int | None = None,
 ) -> dict:
     """
     ### Function to generate settings for scrapy spider.
@@ -24,6 +25,8 @@ def get_settings(
     + _format: The file format (Default: CSV).
     + overwrite: Wether the spider should overwrite the file if it already exists (Default: True)
     + data_path: The path where the file will be saved
+    + concurrent_requests: Maximum number of requests the spider sends at the same time, also used as the per domain limit \
+    (Default: None; Scrapy's defaults are kept, 16 requests in total and 8 per domain).
     ---
     ### Returns:
     A dictionary that contains the settings used by a spider.
@@ -39,6 +42,11 @@ def get_settings(
         },
         "LOG_LEVEL": "INFO",
     }
+    if concurrent_requests is not None:
+        # All the pages of a marathon are on the same domain, so the per domain limit
+        # would otherwise cap the crawl.
+        settings["CONCURRENT_REQUESTS"] = concurrent_requests
+        settings["CONCURRENT_REQUESTS_PER_DOMAIN"] = concurrent_requests
     return settings
 
 